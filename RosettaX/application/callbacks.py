@@ -29,7 +29,10 @@ def register_application_callbacks(app: Dash) -> None:
     """
     logger.debug("Registering app-level callbacks")
 
-    @app.callback(
+    # Collapse toggles fire once per card on every page load and on every
+    # click, so they run in the browser instead of costing a round trip.
+    app.clientside_callback(
+        calibration_cards.CARD_TOGGLE_CLIENTSIDE_FUNCTION,
         Output(
             {"type": calibration_cards.COLLAPSE_ID_TYPE, "page": MATCH, "section": MATCH},
             "is_open",
@@ -49,16 +52,6 @@ def register_application_callbacks(app: Dash) -> None:
         ),
         prevent_initial_call=False,
     )
-    def toggle_calibration_card(
-        _n_clicks: Any,
-        runtime_config_data: Any,
-        is_open: Any,
-    ) -> tuple[bool, str]:
-        return calibration_cards.resolve_card_toggle(
-            triggered_id=dash.ctx.triggered_id,
-            is_open=is_open,
-            runtime_config_data=runtime_config_data,
-        )
 
     @app.callback(
         Output("theme-link", "href"),
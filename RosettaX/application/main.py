@@ -21,7 +21,7 @@ from RosettaX.utils.streamed_uploads import DEFAULT_STREAMED_UPLOAD_DIRECTORY
 from .callbacks import register_application_callbacks
 from .layout import build_application_layout
 from .pages import register_pages
-from .routes import register_server_routes
+from .routes import register_response_compression, register_server_routes
 
 logger = logging.getLogger(__name__)
 
@@ -136,6 +136,7 @@ class RosettaXApplication:
         logger.debug("Registered Dash pages: %r", list(dash.page_registry.keys()))
 
         register_server_routes(self.app)
+        register_response_compression(self.app)
         register_sidebar_callbacks()
         register_application_callbacks(self.app)
 
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+import gzip
 import json
 import logging
 from html import escape
@@ -21,6 +22,10 @@ from RosettaX.utils.upload_limits import format_upload_size
 
 logger = logging.getLogger(__name__)
 
+GZIP_MINIMUM_RESPONSE_BYTES = 1024
+GZIP_COMPRESSION_LEVEL = 5
+GZIP_MIMETYPES = frozenset({"application/json"})
+
 
 def resolve_calibration_file_path(folder: str, file_name: str) -> Path:
     """
@@ -191,3 +196,38 @@ def register_server_routes(app: Dash) -> None:
             error_document = build_calibration_json_error_document()
 
             return Response(error_document, mimetype="text/html", status=400)
+
+
+def register_response_compression(app: Dash) -> None:
+    """
+    Gzip JSON responses for clients that accept it.
+
+    Dash serves page layouts and callback results, including large figure
+    payloads, as JSON. These compress very well and dominate the bytes sent
+    per interaction.
+    """
+    logger.debug("Registering gzip response compression")
+
+    @app.server.after_request
+    def compress_json_response(response: Response) -> Response:
+        if (
+            response.status_code != 200
+            or response.direct_passthrough
+            or response.mimetype not in GZIP_MIMETYPES
+            or "Content-Encoding" in response.headers
+            or "gzip" not in request.headers.get("Accept-Encoding", "").lower()
+        ):
+            return response
+
+        payload = response.get_data()
+
+        if len(payload) < GZIP_MINIMUM_RESPONSE_BYTES:
+            return response
+
+        response.set_data(
+            gzip.compress(payload, compresslevel=GZIP_COMPRESSION_LEVEL)
+        )
+        response.headers["Content-Encoding"] = "gzip"
+        response.vary.add("Accept-Encoding")
+
+        return response
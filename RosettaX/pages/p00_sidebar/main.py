@@ -97,17 +97,27 @@ class Sidebar:
             dash.Input(BROWSER_PROFILES_STORE_ID, "data"),
             dash.State(SidebarIds.saved_profiles_dropdown, "value"),
             dash.State(SidebarIds.selected_profile_store, "data"),
+            dash.State(SidebarIds.saved_profiles_dropdown, "options"),
             prevent_initial_call=False,
         )
         def initialize_or_sync_selected_profile(
             browser_profiles_payload: Any,
             dropdown_value: Optional[str],
             selected_profile_store_data: Optional[str],
+            current_profile_options: Any,
         ):
             profile_options = services.build_saved_profile_options(
                 browser_profiles_payload,
             )
 
+            # Most store writes (profile edits, selection changes) leave the
+            # option list untouched, so only resend it when it actually changed.
+            profile_options_output = (
+                dash.no_update
+                if profile_options == current_profile_options
+                else profile_options
+            )
+
             logger.debug(
                 "initialize_or_sync_selected_profile called with dropdown_value=%r "
                 "selected_profile_store_data=%r profile_options=%r",
@@ -117,7 +127,11 @@ class Sidebar:
             )
 
             if not isinstance(profile_options, list) or not profile_options:
-                return [], None, None
+                return (
+                    dash.no_update if current_profile_options == [] else [],
+                    None,
+                    None,
+                )
 
             option_values = {
                 option.get("value")
@@ -137,9 +151,9 @@ class Sidebar:
                         dropdown_value,
                     )
 
-                    return profile_options, dash.no_update, dropdown_value
+                    return profile_options_output, dash.no_update, dropdown_value
 
-                return profile_options, dash.no_update, dash.no_update
+                return profile_options_output, dash.no_update, dash.no_update
 
             if selected_profile_store_data in option_values:
                 logger.debug(
@@ -147,7 +161,7 @@ class Sidebar:
                     selected_profile_store_data,
                 )
 
-                return profile_options, selected_profile_store_data, dash.no_update
+                return profile_options_output, selected_profile_store_data, dash.no_update
 
             resolved_default_profile = BrowserProfileLibrary.from_dict(
                 browser_profiles_payload,
@@ -158,7 +172,7 @@ class Sidebar:
                 resolved_default_profile,
             )
 
-            return profile_options, resolved_default_profile, resolved_default_profile
+            return profile_options_output, resolved_default_profile, resolved_default_profile
 
         @dash.callback(
             dash.Output(SidebarIds.selected_profile_store, "data", allow_duplicate=True),
@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+
+
+class Ids:
+    """Component identifiers for the home page."""
+
+    page_prefix = "home"
+
+    fluorescence_link = f"{page_prefix}-fluorescence-link"
+    scattering_link = f"{page_prefix}-scattering-link"
+    cross_calibration_link = f"{page_prefix}-cross-calibration-link"
+    apply_link = f"{page_prefix}-apply-link"
+    email_link = f"{page_prefix}-email-link"
@@ -4,6 +4,7 @@ import importlib.metadata
 import json
 import logging
 import time
+from functools import lru_cache
 from typing import Optional
 from urllib import error, request
 
@@ -14,6 +15,8 @@ from dash import html
 from RosettaX.utils import ui_forms
 from RosettaX.utils import usage_metrics
 
+from .ids import Ids
+
 
 logger = logging.getLogger(__name__)
 LATEST_GITHUB_TAG_API_URL = "https://api.github.com/repos/MartinPdeS/RosettaX/tags?per_page=1"
@@ -23,6 +26,173 @@ GITHUB_TAG_CACHE_TTL_SECONDS = 300.0
 _cached_github_tag_label: Optional[str] = None
 _cached_github_tag_expires_at = 0.0
 
+_INSTALL_LOCAL_RELEASE_URL = "/documentation/install-local"
+_SUPPORT_URL = "https://github.com/sponsors/MartinPdeS"
+_LAB_URL = "https://www.vesiclecenter.com/"
+_CITATION_URL = "/citation"
+
+# Narrative copy used by the home page layout, kept apart from the component tree.
+_TEXT: dict[str, str] = {
+    "hero_body": (
+        "Convert raw single-particle flow cytometry data into calibrated measurements. "
+        "Perform fluorescence and light-scattering calibrations, save calibration records, "
+        "and apply them to FCS files."
+    ),
+    "citation_body": (
+        "Support ongoing RosettaX development, cite the work in publications, "
+        "and find the lab affiliation below."
+    ),
+    "fluorescence_workflow": (
+        "Convert arbitrary units of fluorescence intensity into standard units (ABC, ERF, or MESF)."
+    ),
+    "scattering_workflow": (
+        "Convert arbitrary units of scattering intensity into standard units of scattering cross section (nm2) and particle diameter (nm)."
+    ),
+    "cross_calibration_workflow": (
+        "Build an experimental transfer calibration that links a less frequent primary reference bead calibration "
+        "to a cheaper routine-bead calibration on the same detector."
+    ),
+    "apply_workflow": (
+        "Use saved fluorescence and/or scattering calibrations to add calibrated parameters to FCS files."
+    ),
+}
+
+# Style dictionaries reused by the home page helpers.
+_CONTAINER_STYLE = {
+    "paddingTop": "12px",
+    "paddingBottom": "40px",
+}
+
+_VERSION_LABEL_STYLE = {
+    "fontSize": "0.72rem",
+    "fontWeight": "700",
+    "letterSpacing": "0.08em",
+    "textTransform": "uppercase",
+    "opacity": 0.7,
+}
+
+_VERSION_VALUE_STYLE = {
+    "fontSize": "0.92rem",
+    "fontWeight": "700",
+}
+
+_VERSION_WIDGET_STYLE = {
+    "display": "inline-flex",
+    "alignItems": "center",
+    "gap": "10px",
+    "padding": "8px 12px",
+    "borderRadius": "999px",
+    "border": "1px solid rgba(128, 128, 128, 0.22)",
+    "background": "rgba(255, 255, 255, 0.55)",
+    "backdropFilter": "blur(8px)",
+}
+
+_CARD_TITLE_STYLE = {
+    "fontWeight": "750",
+    "fontSize": "1.02rem",
+}
+
+_METRIC_VALUE_STYLE = {
+    "fontSize": "2rem",
+    "fontWeight": "800",
+    "lineHeight": "1.0",
+}
+
+_METRIC_LABEL_STYLE = {
+    "fontSize": "0.92rem",
+    "opacity": 0.76,
+    "marginTop": "6px",
+}
+
+_METRIC_TILE_STYLE = {
+    "padding": "18px",
+    "borderRadius": "12px",
+    "border": "1px solid rgba(13, 110, 253, 0.16)",
+    "background": "rgba(13, 110, 253, 0.04)",
+    "height": "100%",
+}
+
+_WORKFLOW_CARD_TITLE_STYLE = {
+    "fontWeight": "760",
+    "fontSize": "1.08rem",
+    "lineHeight": "1.2",
+}
+
+_WORKFLOW_CARD_SUBTITLE_STYLE = {
+    "fontSize": "0.84rem",
+    "opacity": 0.72,
+    "marginTop": "3px",
+}
+
+_WORKFLOW_CARD_HEADER_STYLE = {
+    "background": "rgba(13, 110, 253, 0.06)",
+    "borderBottom": "1px solid rgba(13, 110, 253, 0.16)",
+    "padding": "12px 16px",
+    "borderTopLeftRadius": "12px",
+    "borderTopRightRadius": "12px",
+}
+
+_WORKFLOW_CARD_DESCRIPTION_STYLE = {
+    "opacity": 0.82,
+    "minHeight": "66px",
+    "marginBottom": "14px",
+}
+
+_WORKFLOW_STEP_LIST_STYLE = {
+    "display": "flex",
+    "flexDirection": "column",
+    "gap": "7px",
+    "marginBottom": "16px",
+}
+
+_FULL_WIDTH_STYLE = {
+    "width": "100%",
+}
+
+_BUTTON_FOOTER_STYLE = {
+    "marginTop": "auto",
+}
+
+_WORKFLOW_CARD_BODY_STYLE = {
+    "height": "100%",
+    "display": "flex",
+    "flexDirection": "column",
+    "padding": "16px",
+}
+
+_WORKFLOW_CARD_STYLE = {
+    "height": "100%",
+    "borderRadius": "12px",
+    "border": "1px solid rgba(13, 110, 253, 0.16)",
+    "boxShadow": "0 0.25rem 0.65rem rgba(0, 0, 0, 0.06)",
+    "overflow": "visible",
+}
+
+_STEP_BADGE_STYLE = {
+    "width": "24px",
+    "height": "24px",
+    "borderRadius": "50%",
+    "display": "flex",
+    "alignItems": "center",
+    "justifyContent": "center",
+    "fontSize": "0.78rem",
+    "fontWeight": "800",
+    "backgroundColor": "rgba(13, 110, 253, 0.10)",
+    "border": "1px solid rgba(13, 110, 253, 0.28)",
+    "flex": "0 0 auto",
+}
+
+_STEP_LABEL_STYLE = {
+    "fontSize": "0.9rem",
+    "opacity": 0.86,
+}
+
+_STEP_ROW_STYLE = {
+    "display": "flex",
+    "alignItems": "center",
+    "gap": "9px",
+}
+
 
 def _fetch_latest_github_tag_label() -> Optional[str]:
     request_headers = {
@@ -111,25 +281,19 @@ class HomePage:
     """
 
     def __init__(self) -> None:
-        self.page_name = "home"
+        self.ids = Ids()
 
         self.github_url = "https://github.com/MartinPdeS/RosettaX"
         self.pypi_url = "https://pypi.org/project/RosettaX/"
         self.anaconda_url = "https://anaconda.org/channels/MartinPdeS/packages/Rosettax/overview"
         self.documentation_url = "/documentation"
-        self.install_local_release_url = "/documentation/install-local"
-        self.support_url = "https://github.com/sponsors/MartinPdeS"
-        self.lab_url = "https://www.vesiclecenter.com/"
+        self.install_local_release_url = _INSTALL_LOCAL_RELEASE_URL
+        self.support_url = _SUPPORT_URL
+        self.lab_url = _LAB_URL
         self.contact_email = "martin.poinsinet.de.sivry@gmail.com"
-        self.citation_url = "/citation"
+        self.citation_url = _CITATION_URL
         self.zenodo_badge_url = "https://zenodo.org/badge/1087203577.svg"
 
-    def _id(
-        self,
-        name: str,
-    ) -> str:
-        return f"{self.page_name}-{name}"
-
     def layout(
         self,
         **_kwargs,
@@ -140,6 +304,8 @@ class HomePage:
             logger.exception("Failed to record home page visit metric.")
             metrics = usage_metrics.load_usage_metrics()
 
+        hero_section, citation_card, workflow_cards_row = _build_static_home_sections()
+
         return dbc.Container(
             [
                 self._github_tag_widget(),
@@ -148,193 +314,21 @@ class HomePage:
                         "height": "12px",
                     },
                 ),
-                self._hero_section(),
-                html.Div(
-                    style={
-                        "height": "18px",
-                    },
-                ),
-                self._citation_card(),
-                html.Div(
-                    style={
-                        "height": "18px",
-                    },
-                ),
-                self._workflow_cards_row(),
-                html.Div(
-                    style={
-                        "height": "18px",
-                    },
-                ),
+                hero_section,
+                ui_forms.SECTION_SPACER,
+                citation_card,
+                ui_forms.SECTION_SPACER,
+                workflow_cards_row,
+                ui_forms.SECTION_SPACER,
                 self._usage_metrics_card(metrics=metrics),
-                html.Div(
-                    style={
-                        "height": "18px",
-                    },
-                ),
+                ui_forms.SECTION_SPACER,
             ],
             fluid=True,
-            style={
-                "paddingTop": "12px",
-                "paddingBottom": "40px",
-            },
+            style=_CONTAINER_STYLE,
         )
 
     def _github_tag_widget(self) -> html.Div:
-        github_tag_label = resolve_latest_github_tag_label()
-
-        return html.Div(
-            [
-                html.Span(
-                    "Version:",
-                    style={
-                        "fontSize": "0.72rem",
-                        "fontWeight": "700",
-                        "letterSpacing": "0.08em",
-                        "textTransform": "uppercase",
-                        "opacity": 0.7,
-                    },
-                ),
-                html.Span(
-                    github_tag_label,
-                    style={
-                        "fontSize": "0.92rem",
-                        "fontWeight": "700",
-                    },
-                ),
-            ],
-            style={
-                "display": "inline-flex",
-                "alignItems": "center",
-                "gap": "10px",
-                "padding": "8px 12px",
-                "borderRadius": "999px",
-                "border": "1px solid rgba(128, 128, 128, 0.22)",
-                "background": "rgba(255, 255, 255, 0.55)",
-                "backdropFilter": "blur(8px)",
-            },
-        )
-
-    def _hero_section(self) -> dbc.Card:
-        card = dbc.Card(
-            [
-                dbc.CardBody(
-                    [
-                        html.Div(
-                            "RosettaX",
-                            style={
-                                "fontWeight": "800",
-                                "fontSize": "2.55rem",
-                                "lineHeight": "1.05",
-                                "marginBottom": "8px",
-                            },
-                        ),
-                        html.Div(
-                            (
-                                "Convert raw single-particle flow cytometry data into calibrated measurements. "
-                                "Perform fluorescence and light-scattering calibrations, save calibration records, "
-                                "and apply them to FCS files."
-                            ),
-                            style={
-                                "fontSize": "1.08rem",
-                                "opacity": 0.86,
-                                "maxWidth": "980px",
-                                "marginBottom": "0px",
-                            },
-                        ),
-                    ],
-                    style={
-                        "padding": "26px",
-                    },
-                ),
-            ]
-        )
-
-        return ui_forms.apply_workflow_section_card_style(
-            card=card,
-            header_font_weight="750",
-            header_font_size="1.02rem",
-        )
-
-    def _citation_card(self) -> dbc.Card:
-        card = dbc.Card(
-            [
-                dbc.CardHeader(
-                    html.Div(
-                        "Support, citation, and lab",
-                        style={
-                            "fontWeight": "750",
-                            "fontSize": "1.02rem",
-                        },
-                    )
-                ),
-                dbc.CardBody(
-                    [
-                        html.Div(
-                            (
-                                "Support ongoing RosettaX development, cite the work in publications, "
-                                "and find the lab affiliation below."
-                            ),
-                            style={
-                                "fontSize": "0.95rem",
-                                "opacity": 0.88,
-                                "marginBottom": "14px",
-                            },
-                        ),
-                        html.Div(
-                            [
-                                dbc.Button(
-                                    "Support Developer",
-                                    href=self.support_url,
-                                    color="warning",
-                                    target="_blank",
-                                    rel="noopener noreferrer",
-                                    style={
-                                        "fontWeight": "700",
-                                    },
-                                ),
-                                dbc.Button(
-                                    "Citing this work",
-                                    href=self.citation_url,
-                                    color="primary",
-                                    outline=True,
-                                ),
-                                dbc.Button(
-                                    "Amsterdam Vesicle Center",
-                                    href=self.lab_url,
-                                    color="info",
-                                    outline=True,
-                                    target="_blank",
-                                    rel="noopener noreferrer",
-                                ),
-                                dbc.Button(
-                                    "Install locally (Releases)",
-                                    href=self.install_local_release_url,
-                                    color="secondary",
-                                    outline=True,
-                                ),
-                            ],
-                            style={
-                                "display": "flex",
-                                "alignItems": "center",
-                                "gap": "10px",
-                                "flexWrap": "wrap",
-                                "marginBottom": "0px",
-                            },
-                        ),
-                    ],
-                    style={
-                        "padding": "20px",
-                    },
-                ),
-            ]
-        )
-
-        return ui_forms.apply_workflow_section_card_style(
-            card=card,
-            header_font_weight="750",
-            header_font_size="1.02rem",
-        )
+        return _build_version_widget(resolve_latest_github_tag_label())
 
     def _usage_metrics_card(
         self,
@@ -347,10 +341,7 @@ class HomePage:
                     [
                         html.Div(
                             "RosettaX usage metrics.",
-                            style={
-                                "fontWeight": "750",
-                                "fontSize": "1.02rem",
-                            },
+                            style=_CARD_TITLE_STYLE,
                         ),
                     ]
                 ),
@@ -404,258 +395,14 @@ class HomePage:
             [
                 html.Div(
                     value,
-                    style={
-                        "fontSize": "2rem",
-                        "fontWeight": "800",
-                        "lineHeight": "1.0",
-                    },
+                    style=_METRIC_VALUE_STYLE,
                 ),
                 html.Div(
                     label,
-                    style={
-                        "fontSize": "0.92rem",
-                        "opacity": 0.76,
-                        "marginTop": "6px",
-                    },
+                    style=_METRIC_LABEL_STYLE,
                 ),
             ],
-            style={
-                "padding": "18px",
-                "borderRadius": "12px",
-                "border": "1px solid rgba(13, 110, 253, 0.16)",
-                "background": "rgba(13, 110, 253, 0.04)",
-                "height": "100%",
-            },
-        )
-
-    def _workflow_cards_row(self) -> dbc.Row:
-        return dbc.Row(
-            [
-                dbc.Col(
-                    self._workflow_card(
-                        title="Fluorescence calibration",
-                        subtitle="",
-                        description=(
-                            "Convert arbitrary units of fluorescence intensity into standard units (ABC, ERF, or MESF)."
-                        ),
-                        steps=[
-                            "Upload bead FCS file",
-                            "Detect fluorescence peaks",
-                            "Add standard units to calibration table",
-                            "Create calibration",
-                            "Save calibration",
-                        ],
-                        button_text="Open fluorescence workflow",
-                        button_href="/fluorescence",
-                        button_color="primary",
-                        button_id=self._id("fluorescence-link"),
-                    ),
-                    lg=3,
-                ),
-                dbc.Col(
-                    self._workflow_card(
-                        title="Scattering calibration",
-                        subtitle="",
-                        description=(
-                            "Convert arbitrary units of scattering intensity into standard units of scattering cross section (nm2) and particle diameter (nm)."
-                        ),
-                        steps=[
-                            "Upload bead FCS file",
-                            "Detect scattering peaks",
-                            "Set optical configuration",
-                            "Add standard units to calibration table",
-                            "Fit response",
-                            "Save calibration",
-                        ],
-                        button_text="Open scattering workflow",
-                        button_href="/scattering",
-                        button_color="primary",
-                        button_id=self._id("scattering-link"),
-                    ),
-                    lg=3,
-                ),
-                dbc.Col(
-                    self._workflow_card(
-                        title="Cross calibration",
-                        subtitle="",
-                        description=(
-                            "Build an experimental transfer calibration that links a less frequent primary reference bead calibration "
-                            "to a cheaper routine-bead calibration on the same detector."
-                        ),
-                        steps=[
-                            "Upload primary calibration",
-                            "Upload secondary routine-bead calibration",
-                            "Fit transfer relation",
-                            "Export transfer calibration",
-                        ],
-                        button_text="Open cross-calibration workflow",
-                        button_href="/cross-calibration",
-                        button_color="warning",
-                        button_id=self._id("cross-calibration-link"),
-                    ),
-                    lg=3,
-                ),
-                dbc.Col(
-                    self._workflow_card(
-                        title="Apply calibration",
-                        subtitle="",
-                        description=(
-                            "Use saved fluorescence and/or scattering calibrations to add calibrated parameters to FCS files."
-                        ),
-                        steps=[
-                            "Upload calibration file",
-                            "Upload uncalibrated FCS file(s)",
-                            "Select parameters to export",
-                            "Apply and export calibrated FCS file(s)",
-                        ],
-                        button_text="Open apply workflow",
-                        button_href="/calibrate",
-                        button_color="success",
-                        button_id=self._id("apply-link"),
-                    ),
-                    lg=3,
-                ),
-            ],
-            className="g-3",
-        )
-
-    def _workflow_card(
-        self,
-        *,
-        title: str,
-        subtitle: str,
-        description: str,
-        steps: list[str],
-        button_text: str,
-        button_href: str,
-        button_color: str,
-        button_id: str,
-    ) -> dbc.Card:
-        return dbc.Card(
-            [
-                dbc.CardHeader(
-                    [
-                        html.Div(
-                            title,
-                            style={
-                                "fontWeight": "760",
-                                "fontSize": "1.08rem",
-                                "lineHeight": "1.2",
-                            },
-                        ),
-                        html.Div(
-                            subtitle,
-                            style={
-                                "fontSize": "0.84rem",
-                                "opacity": 0.72,
-                                "marginTop": "3px",
-                            },
-                        ),
-                    ],
-                    style={
-                        "background": "rgba(13, 110, 253, 0.06)",
-                        "borderBottom": "1px solid rgba(13, 110, 253, 0.16)",
-                        "padding": "12px 16px",
-                        "borderTopLeftRadius": "12px",
-                        "borderTopRightRadius": "12px",
-                    },
-                ),
-                dbc.CardBody(
-                    [
-                        html.P(
-                            description,
-                            style={
-                                "opacity": 0.82,
-                                "minHeight": "66px",
-                                "marginBottom": "14px",
-                            },
-                        ),
-                        html.Div(
-                            [
-                                self._workflow_step_pill(
-                                    index=index + 1,
-                                    label=step,
-                                )
-                                for index, step in enumerate(
-                                    steps,
-                                )
-                            ],
-                            style={
-                                "display": "flex",
-                                "flexDirection": "column",
-                                "gap": "7px",
-                                "marginBottom": "16px",
-                            },
-                        ),
-                        html.Div(
-                            dbc.Button(
-                                button_text,
-                                href=button_href,
-                                id=button_id,
-                                color=button_color,
-                                style={
-                                    "width": "100%",
-                                },
-                            ),
-                            style={
-                                "marginTop": "auto",
-                            },
-                        ),
-                    ],
-                    style={
-                        "height": "100%",
-                        "display": "flex",
-                        "flexDirection": "column",
-                        "padding": "16px",
-                    },
-                ),
-            ],
-            style={
-                "height": "100%",
-                "borderRadius": "12px",
-                "border": "1px solid rgba(13, 110, 253, 0.16)",
-                "boxShadow": "0 0.25rem 0.65rem rgba(0, 0, 0, 0.06)",
-                "overflow": "visible",
-            },
-        )
-
-    def _workflow_step_pill(
-        self,
-        *,
-        index: int,
-        label: str,
-    ) -> html.Div:
-        return html.Div(
-            [
-                html.Div(
-                    str(index),
-                    style={
-                        "width": "24px",
-                        "height": "24px",
-                        "borderRadius": "50%",
-                        "display": "flex",
-                        "alignItems": "center",
-                        "justifyContent": "center",
-                        "fontSize": "0.78rem",
-                        "fontWeight": "800",
-                        "backgroundColor": "rgba(13, 110, 253, 0.10)",
-                        "border": "1px solid rgba(13, 110, 253, 0.28)",
-                        "flex": "0 0 auto",
-                    },
-                ),
-                html.Div(
-                    label,
-                    style={
-                        "fontSize": "0.9rem",
-                        "opacity": 0.86,
-                    },
-                ),
-            ],
-            style={
-                "display": "flex",
-                "alignItems": "center",
-                "gap": "9px",
-            },
+            style=_METRIC_TILE_STYLE,
         )
 
     def _secondary_actions_card(self) -> dbc.Card:
@@ -665,10 +412,7 @@ class HomePage:
                     [
                         html.Div(
                             "Project resources",
-                            style={
-                                "fontWeight": "750",
-                                "fontSize": "1.02rem",
-                            },
+                            style=_CARD_TITLE_STYLE,
                         ),
                         html.Div(
                             "Documentation, source code, package links, and project support.",
@@ -748,7 +492,7 @@ class HomePage:
                                 html.A(
                                     self.contact_email,
                                     href=f"mailto:{self.contact_email}",
-                                    id=self._id("email-link"),
+                                    id=self.ids.email_link,
                                 ),
                             ],
                             style={
@@ -787,9 +531,7 @@ class HomePage:
             outline=outline,
             target=target,
             rel="noopener noreferrer",
-            style={
-                "width": "100%",
-            },
+            style=_FULL_WIDTH_STYLE,
         )
 
     def _footer_links(self) -> html.Div:
@@ -804,6 +546,324 @@ class HomePage:
         )
 
 
+# Section builders shared by HomePage.layout and the static-section cache.
+# They only depend on module constants, so they live outside the page class.
+def _build_hero_section() -> dbc.Card:
+    card = dbc.Card(
+        [
+            dbc.CardBody(
+                [
+                    html.Div(
+                        "RosettaX",
+                        style={
+                            "fontWeight": "800",
+                            "fontSize": "2.55rem",
+                            "lineHeight": "1.05",
+                            "marginBottom": "8px",
+                        },
+                    ),
+                    html.Div(
+                        _TEXT["hero_body"],
+                        style={
+                            "fontSize": "1.08rem",
+                            "opacity": 0.86,
+                            "maxWidth": "980px",
+                            "marginBottom": "0px",
+                        },
+                    ),
+                ],
+                style={
+                    "padding": "26px",
+                },
+            ),
+        ]
+    )
+
+    return ui_forms.apply_workflow_section_card_style(
+        card=card,
+        header_font_weight="750",
+        header_font_size="1.02rem",
+    )
+
+
+def _build_citation_card() -> dbc.Card:
+    card = dbc.Card(
+        [
+            dbc.CardHeader(
+                html.Div(
+                    "Support, citation, and lab",
+                    style=_CARD_TITLE_STYLE,
+                )
+            ),
+            dbc.CardBody(
+                [
+                    html.Div(
+                        _TEXT["citation_body"],
+                        style={
+                            "fontSize": "0.95rem",
+                            "opacity": 0.88,
+                            "marginBottom": "14px",
+                        },
+                    ),
+                    html.Div(
+                        [
+                            dbc.Button(
+                                "Support Developer",
+                                href=_SUPPORT_URL,
+                                color="warning",
+                                target="_blank",
+                                rel="noopener noreferrer",
+                                style={
+                                    "fontWeight": "700",
+                                },
+                            ),
+                            dbc.Button(
+                                "Citing this work",
+                                href=_CITATION_URL,
+                                color="primary",
+                                outline=True,
+                            ),
+                            dbc.Button(
+                                "Amsterdam Vesicle Center",
+                                href=_LAB_URL,
+                                color="info",
+                                outline=True,
+                                target="_blank",
+                                rel="noopener noreferrer",
+                            ),
+                            dbc.Button(
+                                "Install locally (Releases)",
+                                href=_INSTALL_LOCAL_RELEASE_URL,
+                                color="secondary",
+                                outline=True,
+                            ),
+                        ],
+                        style={
+                            "display": "flex",
+                            "alignItems": "center",
+                            "gap": "10px",
+                            "flexWrap": "wrap",
+                            "marginBottom": "0px",
+                        },
+                    ),
+                ],
+                style={
+                    "padding": "20px",
+                },
+            ),
+        ]
+    )
+
+    return ui_forms.apply_workflow_section_card_style(
+        card=card,
+        header_font_weight="750",
+        header_font_size="1.02rem",
+    )
+
+
+def _build_workflow_cards_row() -> dbc.Row:
+    return dbc.Row(
+        [
+            dbc.Col(
+                _build_workflow_card(
+                    title="Fluorescence calibration",
+                    subtitle="",
+                    description=_TEXT["fluorescence_workflow"],
+                    steps=[
+                        "Upload bead FCS file",
+                        "Detect fluorescence peaks",
+                        "Add standard units to calibration table",
+                        "Create calibration",
+                        "Save calibration",
+                    ],
+                    button_text="Open fluorescence workflow",
+                    button_href="/fluorescence",
+                    button_color="primary",
+                    button_id=Ids.fluorescence_link,
+                ),
+                lg=3,
+            ),
+            dbc.Col(
+                _build_workflow_card(
+                    title="Scattering calibration",
+                    subtitle="",
+                    description=_TEXT["scattering_workflow"],
+                    steps=[
+                        "Upload bead FCS file",
+                        "Detect scattering peaks",
+                        "Set optical configuration",
+                        "Add standard units to calibration table",
+                        "Fit response",
+                        "Save calibration",
+                    ],
+                    button_text="Open scattering workflow",
+                    button_href="/scattering",
+                    button_color="primary",
+                    button_id=Ids.scattering_link,
+                ),
+                lg=3,
+            ),
+            dbc.Col(
+                _build_workflow_card(
+                    title="Cross calibration",
+                    subtitle="",
+                    description=_TEXT["cross_calibration_workflow"],
+                    steps=[
+                        "Upload primary calibration",
+                        "Upload secondary routine-bead calibration",
+                        "Fit transfer relation",
+                        "Export transfer calibration",
+                    ],
+                    button_text="Open cross-calibration workflow",
+                    button_href="/cross-calibration",
+                    button_color="warning",
+                    button_id=Ids.cross_calibration_link,
+                ),
+                lg=3,
+            ),
+            dbc.Col(
+                _build_workflow_card(
+                    title="Apply calibration",
+                    subtitle="",
+                    description=_TEXT["apply_workflow"],
+                    steps=[
+                        "Upload calibration file",
+                        "Upload uncalibrated FCS file(s)",
+                        "Select parameters to export",
+                        "Apply and export calibrated FCS file(s)",
+                    ],
+                    button_text="Open apply workflow",
+                    button_href="/calibrate",
+                    button_color="success",
+                    button_id=Ids.apply_link,
+                ),
+                lg=3,
+            ),
+        ],
+        className="g-3",
+    )
+
+
+def _build_workflow_card(
+    *,
+    title: str,
+    subtitle: str,
+    description: str,
+    steps: list[str],
+    button_text: str,
+    button_href: str,
+    button_color: str,
+    button_id: str,
+) -> dbc.Card:
+    return dbc.Card(
+        [
+            dbc.CardHeader(
+                [
+                    html.Div(
+                        title,
+                        style=_WORKFLOW_CARD_TITLE_STYLE,
+                    ),
+                    html.Div(
+                        subtitle,
+                        style=_WORKFLOW_CARD_SUBTITLE_STYLE,
+                    ),
+                ],
+                style=_WORKFLOW_CARD_HEADER_STYLE,
+            ),
+            dbc.CardBody(
+                [
+                    html.P(
+                        description,
+                        style=_WORKFLOW_CARD_DESCRIPTION_STYLE,
+                    ),
+                    html.Div(
+                        [
+                            _build_workflow_step_pill(
+                                index=index + 1,
+                                label=step,
+                            )
+                            for index, step in enumerate(
+                                steps,
+                            )
+                        ],
+                        style=_WORKFLOW_STEP_LIST_STYLE,
+                    ),
+                    html.Div(
+                        dbc.Button(
+                            button_text,
+                            href=button_href,
+                            id=button_id,
+                            color=button_color,
+                            style=_FULL_WIDTH_STYLE,
+                        ),
+                        style=_BUTTON_FOOTER_STYLE,
+                    ),
+                ],
+                style=_WORKFLOW_CARD_BODY_STYLE,
+            ),
+        ],
+        style=_WORKFLOW_CARD_STYLE,
+    )
+
+
+def _build_workflow_step_pill(
+    *,
+    index: int,
+    label: str,
+) -> html.Div:
+    return html.Div(
+        [
+            html.Div(
+                str(index),
+                style=_STEP_BADGE_STYLE,
+            ),
+            html.Div(
+                label,
+                style=_STEP_LABEL_STYLE,
+            ),
+        ],
+        style=_STEP_ROW_STYLE,
+    )
+
+
+@lru_cache(maxsize=1)
+def _build_static_home_sections() -> tuple[dbc.Card, dbc.Card, dbc.Row]:
+    """
+    Build the home page sections that do not depend on per-visit state once per
+    Python process.
+
+    The version widget and usage metrics card are rebuilt on every visit.
+    """
+    return (
+        _build_hero_section(),
+        _build_citation_card(),
+        _build_workflow_cards_row(),
+    )
+
+
+@lru_cache(maxsize=4)
+def _build_version_widget(github_tag_label: str) -> html.Div:
+    """
+    Build the version widget once per distinct release label.
+
+    The label only changes when a new tag is published, so successive visits
+    reuse the same component.
+    """
+    return html.Div(
+        [
+            html.Span(
+                "Version:",
+                style=_VERSION_LABEL_STYLE,
+            ),
+            html.Span(
+                github_tag_label,
+                style=_VERSION_VALUE_STYLE,
+            ),
+        ],
+        style=_VERSION_WIDGET_STYLE,
+    )
+
+
 _page = HomePage()
 layout = _page.layout
 
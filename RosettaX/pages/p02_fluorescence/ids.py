@@ -8,7 +8,7 @@ from RosettaX.workflow.save.ids import SaveIds as SaveSectionIds
 from RosettaX.workflow.peak.ids import PeakIds
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CalibrationSectionIds:
     """
     ID factory for the fluorescence calibration section.
@@ -16,10 +16,6 @@ class CalibrationSectionIds:
 
     prefix: str
 
-    @property
-    def collapse(self) -> str:
-        return f"{self.prefix}-calibration-collapse"
-
     @property
     def graph_store(self) -> str:
         return f"{self.prefix}-calibration-graph-store"
@@ -1,11 +1,13 @@
 # -*- coding: utf-8 -*-
 
-from typing import Self
+from typing import Any, Optional, Self
 
 import dash
 
+from RosettaX.utils.runtime_config import RuntimeConfig
+from RosettaX.workflow.calibration_cards import register_section_callbacks
+
 from .ids import Ids
-from .sections import callbacks as section_callbacks
 from .sections import layout as section_layout
 from .sections import services as section_services
 
@@ -24,6 +26,8 @@ class FluorescencePage:
 
         self.sections = section_services.build_sections(self)
 
+        self._layout_cache: Optional[tuple[Any, dash.html.Div]] = None
+
     def register_callbacks(self) -> Self:
         """
         Register all section callbacks.
@@ -33,19 +37,30 @@ class FluorescencePage:
         Self
             Current page instance.
         """
-        section_callbacks.register_callbacks(self.sections)
+        register_section_callbacks(self.sections)
         return self
 
     def layout(self) -> dash.html.Div:
         """
         Build the fluorescence page layout.
 
+        The layout only depends on the startup default profile, so the built
+        tree is reused until that profile changes.
+
         Returns
         -------
         dash.html.Div
             Page layout.
         """
-        return section_layout.build_page_layout(self, self.sections)
+        profile_signature = RuntimeConfig.default_profile_signature()
+
+        if self._layout_cache is None or self._layout_cache[0] != profile_signature:
+            self._layout_cache = (
+                profile_signature,
+                section_layout.build_page_layout(self, self.sections),
+            )
+
+        return self._layout_cache[1]
 
 
 _page = FluorescencePage().register_callbacks()
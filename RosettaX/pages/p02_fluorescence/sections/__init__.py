@@ -1,10 +1,3 @@
-from .s00_header import Header
-from .s01_upload import Upload
-from .s02_peaks import Peaks
-from .s03_table import ReferenceTable
-from .s04_calibration import Calibration
-from .s05_save import Save
-
 __all__ = [
     "Header",
     "Upload",
@@ -12,4 +5,33 @@ __all__ = [
     "ReferenceTable",
     "Calibration",
     "Save",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    if name == "Header":
+        from .s00_header.main import Header
+
+        return Header
+    if name == "Upload":
+        from .s01_upload.main import Upload
+
+        return Upload
+    if name == "Peaks":
+        from .s02_peaks.main import Peaks
+
+        return Peaks
+    if name == "ReferenceTable":
+        from .s03_table.main import ReferenceTable
+
+        return ReferenceTable
+    if name == "Calibration":
+        from .s04_calibration.main import Calibration
+
+        return Calibration
+    if name == "Save":
+        from .s05_save.main import Save
+
+        return Save
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -2,7 +2,7 @@
 
 import dash
 
-from RosettaX.workflow.calibration_cards import build_collapsible_section_layout
+from RosettaX.workflow.calibration_cards import build_collapsible_section_layouts
 
 from ..state import FluorescencePageState
 
@@ -19,15 +19,10 @@ def build_page_layout(page, sections) -> dash.html.Div:
                 storage_type="session",
             ),
             dash.html.Div(
-                [
-                    *[
-                        build_collapsible_section_layout(
-                            section,
-                            page_name=page.ids.page_name,
-                        )
-                        for section in sections
-                    ],
-                ],
+                build_collapsible_section_layouts(
+                    sections,
+                    page_name=page.ids.page_name,
+                ),
                 style={
                     "display": "flex",
                     "flexDirection": "column",
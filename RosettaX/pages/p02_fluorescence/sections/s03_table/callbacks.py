@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from typing import Any, Optional
+import json
 import logging
 
 import dash
@@ -14,6 +15,23 @@ from RosettaX.workflow.table.fluorescence import FluorescenceReferenceTable
 logger = logging.getLogger(__name__)
 
 
+# Mirrors FluorescenceReferenceTable.add_empty_row: non dict rows are dropped
+# and one copy of the empty row template is appended.
+_ADD_ROW_CLIENTSIDE_FUNCTION = """
+function(nClicks, rows) {
+    if (!nClicks) {
+        return window.dash_clientside.no_update;
+    }
+
+    const nextRows = Array.isArray(rows)
+        ? rows.filter((row) => row !== null && typeof row === "object" && !Array.isArray(row))
+        : [];
+
+    return nextRows.concat([%s]);
+}
+""" % json.dumps(FluorescenceReferenceTable.empty_row)
+
+
 def resolve_detector_change_reset(
     *,
     detector_dropdown_values: list[Any],
@@ -229,9 +247,13 @@ def _register_preset_sync_callback(section) -> None:
 def _register_add_row_callback(section) -> None:
     """
     Register the add row callback.
+
+    Appending the fixed empty row needs no server state, so it runs in the
+    browser and a click does not cost a round trip to the server.
     """
 
-    @dash.callback(
+    dash.clientside_callback(
+        _ADD_ROW_CLIENTSIDE_FUNCTION,
         dash.Output(
             section.ids.bead_table,
             "data",
@@ -241,26 +263,6 @@ def _register_add_row_callback(section) -> None:
         dash.State(section.ids.bead_table, "data"),
         prevent_initial_call=True,
     )
-    def add_row(
-        n_clicks: int,
-        rows: Optional[list[dict[str, Any]]],
-    ) -> list[dict[str, Any]]:
-        logger.debug(
-            "add_row called with n_clicks=%r existing_row_count=%r",
-            n_clicks,
-            None if rows is None else len(rows),
-        )
-
-        next_rows = FluorescenceReferenceTable.add_empty_row(
-            rows=rows,
-        )
-
-        logger.debug(
-            "add_row returning next_row_count=%r",
-            len(next_rows),
-        )
-
-        return next_rows
 
 
 def _register_detector_change_reset_callback(section) -> None:
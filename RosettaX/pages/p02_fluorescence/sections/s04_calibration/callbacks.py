@@ -7,7 +7,7 @@ import dash
 import plotly.graph_objs as go
 
 from RosettaX.pages.p02_fluorescence.state import FluorescencePageState
-from RosettaX.utils import RuntimeConfig, plottings, styling
+from RosettaX.utils import RuntimeConfig, styling
 from . import services
 
 
@@ -70,54 +70,22 @@ def _register_graph_render_callback(section) -> None:
             type(stored_figure).__name__,
         )
 
+        if not stored_figure:
+            return services.build_empty_calibration_graph(
+                runtime_config_data=runtime_config_data,
+            )
+
         figure = services.rebuild_calibration_graph(
             stored_figure=stored_figure,
-            empty_message="Create a calibration first.",
+            empty_message=services.EMPTY_CALIBRATION_GRAPH_MESSAGE,
             failure_message="Failed to render calibration graph.",
             logger=logger,
         )
 
-        return _finalize_figure_size(figure=figure, runtime_config_data=runtime_config_data)
-
-
-def _finalize_figure_size(
-    *,
-    figure: go.Figure,
-    runtime_config_data: Any = None,
-) -> go.Figure:
-    """
-    Apply the section graph layout and legend placement.
-
-    The graph height is controlled by the Dash component CSS style, not by
-    Plotly layout height. Axis automargins are disabled so long axis titles
-    cannot shrink the plotting area unpredictably.
-    """
-    runtime_config = RuntimeConfig.from_dict(
-        runtime_config_data if isinstance(runtime_config_data, dict) else None
-    )
-
-    visualization_settings = plottings.resolve_runtime_visualization_settings(
-        runtime_config,
-    )
-
-    return plottings.apply_calibration_chart_style(
-        figure,
-        marker_size=float(visualization_settings["default_marker_size"]),
-        marker_opacity=float(visualization_settings["default_marker_opacity"]),
-        line_width=float(visualization_settings["default_line_width"]),
-        font_size=float(visualization_settings["default_font_size"]),
-        tick_size=float(visualization_settings["default_tick_size"]),
-        show_grid=bool(visualization_settings["show_grid"]),
-        legend_vertical_anchor=str(visualization_settings["legend_vertical_anchor"]),
-        annotation_text_position=str(visualization_settings["annotation_text_position"]),
-        margin={
-            "l": 92,
-            "r": 28,
-            "t": 18,
-            "b": 78,
-        },
-        clear_title_text=True,
-    )
+        return services.finalize_calibration_graph(
+            figure=figure,
+            runtime_config_data=runtime_config_data,
+        )
 
 
 def _get_fluorescence_detector_dropdown_pattern(section) -> Any:
@@ -242,6 +210,9 @@ def _register_calibration_workflow_callback(section) -> None:
         fluorescence_detector_dropdown_ids: list[dict[str, Any]],
         fluorescence_detector_dropdown_values: list[Any],
     ) -> tuple:
+        if not n_clicks:
+            return (dash.no_update,) * 6
+
         page_state = FluorescencePageState.from_dict(
             page_state_payload if isinstance(page_state_payload, dict) else None
         )
@@ -8,6 +8,7 @@ import dash_bootstrap_components as dbc
 
 from RosettaX.utils import styling, ui_forms
 from RosettaX.utils.runtime_config import RuntimeConfig
+from . import services
 
 
 logger = logging.getLogger(__name__)
@@ -22,7 +23,7 @@ def get_layout(section) -> dbc.Card:
     return dbc.Card(
         [
             _build_header(section),
-            _build_collapse(section),
+            _build_body(section),
         ],
         style=ui_forms.build_workflow_section_card_style(
             color_name=section.card_color,
@@ -57,17 +58,6 @@ def _build_header(section) -> dbc.CardHeader:
     )
 
 
-def _build_collapse(section) -> dbc.Collapse:
-    """
-    Build the collapsible section body.
-    """
-    return dbc.Collapse(
-        _build_body(section),
-        id=section.ids.collapse,
-        is_open=True,
-    )
-
-
 def _build_body(section) -> dbc.CardBody:
     """
     Build the card body.
@@ -160,6 +150,9 @@ def _build_graph_block(section) -> dash.html.Div:
             dash.dcc.Loading(
                 dash.dcc.Graph(
                     id=section.ids.graph_calibration,
+                    figure=services.build_empty_calibration_graph(
+                        runtime_config_data=RuntimeConfig.from_default_profile().to_dict(),
+                    ),
                     style=_build_graph_style(section),
                     config=styling.PLOTLY_GRAPH_CONFIG,
                 ),
@@ -9,10 +9,12 @@ import dash
 import numpy as np
 import plotly.graph_objs as go
 
-from RosettaX.utils import casting
+from RosettaX.utils import casting, plottings
 from RosettaX.utils.reader import FCSFile
 from RosettaX.utils.plottings import _make_info_figure
+from RosettaX.utils.runtime_config import RuntimeConfig
 
+EMPTY_CALIBRATION_GRAPH_MESSAGE = "Create a calibration first."
 
 
 @dataclass
@@ -175,6 +177,62 @@ def rebuild_calibration_graph(
         )
 
 
+def finalize_calibration_graph(
+    *,
+    figure: go.Figure,
+    runtime_config_data: Any = None,
+) -> go.Figure:
+    """
+    Apply the section graph layout and legend placement.
+
+    The graph height is controlled by the Dash component CSS style, not by
+    Plotly layout height. Axis automargins are disabled so long axis titles
+    cannot shrink the plotting area unpredictably.
+    """
+    runtime_config = RuntimeConfig.from_dict(
+        runtime_config_data if isinstance(runtime_config_data, dict) else None
+    )
+
+    visualization_settings = plottings.resolve_runtime_visualization_settings(
+        runtime_config,
+    )
+
+    return plottings.apply_calibration_chart_style(
+        figure,
+        marker_size=float(visualization_settings["default_marker_size"]),
+        marker_opacity=float(visualization_settings["default_marker_opacity"]),
+        line_width=float(visualization_settings["default_line_width"]),
+        font_size=float(visualization_settings["default_font_size"]),
+        tick_size=float(visualization_settings["default_tick_size"]),
+        show_grid=bool(visualization_settings["show_grid"]),
+        legend_vertical_anchor=str(visualization_settings["legend_vertical_anchor"]),
+        annotation_text_position=str(visualization_settings["annotation_text_position"]),
+        margin={
+            "l": 92,
+            "r": 28,
+            "t": 18,
+            "b": 78,
+        },
+        clear_title_text=True,
+    )
+
+
+def build_empty_calibration_graph(
+    *,
+    runtime_config_data: Any = None,
+) -> go.Figure:
+    """
+    Build the placeholder shown while no calibration figure is stored.
+
+    The layout ships this figure as the initial graph content, and the render
+    callback returns it again whenever the graph store is empty.
+    """
+    return finalize_calibration_graph(
+        figure=_make_info_figure(EMPTY_CALIBRATION_GRAPH_MESSAGE),
+        runtime_config_data=runtime_config_data,
+    )
+
+
 def add_empty_row(
     *,
     rows: list[dict[str, Any]] | None,
@@ -235,36 +293,36 @@ def extract_xy_from_table(
     ExtractedCalibrationPoints
         Paired arrays of calibrated-unit and arbitrary-unit intensity values.
     """
-    intensity_calibrated_units_values: list[float] = []
-    intensity_au_values: list[float] = []
+    point_pairs: list[tuple[float, float]] = []
 
     for row in table_data or []:
         intensity_calibrated_units = casting.as_float(
             row.get("col1"),
         )
+
+        if intensity_calibrated_units is None:
+            continue
+
         intensity_au = casting.as_float(
             row.get("col2"),
         )
 
-        if intensity_calibrated_units is None or intensity_au is None:
+        if intensity_au is None:
             continue
 
-        intensity_calibrated_units_values.append(
-            float(intensity_calibrated_units)
-        )
-        intensity_au_values.append(
-            float(intensity_au)
+        point_pairs.append(
+            (intensity_calibrated_units, intensity_au)
         )
 
+    # One (n, 2) allocation; the returned columns are views into it.
+    point_array = np.asarray(
+        point_pairs,
+        dtype=float,
+    ).reshape(-1, 2)
+
     return ExtractedCalibrationPoints(
-        intensity_calibrated_units=np.asarray(
-            intensity_calibrated_units_values,
-            dtype=float,
-        ),
-        intensity_au=np.asarray(
-            intensity_au_values,
-            dtype=float,
-        ),
+        intensity_calibrated_units=point_array[:, 0],
+        intensity_au=point_array[:, 1],
     )
 
 
@@ -365,13 +423,14 @@ def fit_log10_calibration(
         dtype=float,
     )
 
-    finite_mask = np.isfinite(intensity_au) & np.isfinite(intensity_calibrated_units)
-    intensity_au = intensity_au[finite_mask]
-    intensity_calibrated_units = intensity_calibrated_units[finite_mask]
-
-    positive_mask = (intensity_au > 0.0) & (intensity_calibrated_units > 0.0)
-    intensity_au = intensity_au[positive_mask]
-    intensity_calibrated_units = intensity_calibrated_units[positive_mask]
+    valid_mask = (
+        np.isfinite(intensity_au)
+        & np.isfinite(intensity_calibrated_units)
+        & (intensity_au > 0.0)
+        & (intensity_calibrated_units > 0.0)
+    )
+    intensity_au = intensity_au[valid_mask]
+    intensity_calibrated_units = intensity_calibrated_units[valid_mask]
 
     if intensity_au.size < 2:
         raise ValueError(
@@ -387,11 +446,23 @@ def fit_log10_calibration(
             "positive values for a log10 calibration fit."
         )
 
-    slope, intercept = np.polyfit(
-        intensity_au_log10,
-        intensity_calibrated_units_log10,
-        1,
+    # Closed-form ordinary least squares; np.polyfit would build a
+    # Vandermonde matrix and solve it by SVD for the same two parameters.
+    intensity_au_log10_mean = float(np.mean(intensity_au_log10))
+    intensity_calibrated_units_log10_mean = float(np.mean(intensity_calibrated_units_log10))
+    intensity_au_log10_centered = intensity_au_log10 - intensity_au_log10_mean
+
+    slope = float(
+        np.dot(
+            intensity_au_log10_centered,
+            intensity_calibrated_units_log10 - intensity_calibrated_units_log10_mean,
+        )
+        / np.dot(
+            intensity_au_log10_centered,
+            intensity_au_log10_centered,
+        )
     )
+    intercept = intensity_calibrated_units_log10_mean - slope * intensity_au_log10_mean
 
     intensity_calibrated_units_log10_predicted = (
         slope * intensity_au_log10 + intercept
@@ -597,7 +668,8 @@ def build_calibration_figure(
     Build a Plotly scatter figure showing the log–log calibration fit.
 
     The figure contains a scatter trace for the bead measurement points and a
-    line trace for the fitted model.
+    line trace for the fitted model. Both traces use WebGL rendering so
+    redrawing the figure does not grow the SVG DOM.
 
     Parameters
     ----------
@@ -624,17 +696,21 @@ def build_calibration_figure(
         dtype=float,
     )
 
-    x_log10_fit = np.linspace(
-        float(np.min(x_log10)),
-        float(np.max(x_log10)),
-        200,
+    # The fit is a straight line in log10 space, so its two end points draw
+    # it exactly and keep the stored figure independent of a sampling grid.
+    x_log10_fit = np.asarray(
+        [
+            float(np.min(x_log10)),
+            float(np.max(x_log10)),
+        ],
+        dtype=float,
     )
     y_log10_fit = slope * x_log10_fit + intercept
 
     figure = go.Figure()
 
     figure.add_trace(
-        go.Scatter(
+        go.Scattergl(
             x=x_log10,
             y=y_log10,
             mode="markers",
@@ -642,7 +718,7 @@ def build_calibration_figure(
         )
     )
     figure.add_trace(
-        go.Scatter(
+        go.Scattergl(
             x=x_log10_fit,
             y=y_log10_fit,
             mode="lines",
@@ -661,6 +737,40 @@ def build_calibration_figure(
     return figure
 
 
+def build_calibration_figure_store(
+    *,
+    x_log10: np.ndarray,
+    y_log10: np.ndarray,
+    slope: float,
+    intercept: float,
+) -> dict[str, Any]:
+    """
+    Return the calibration figure serialised for the graph store.
+
+    Parameters
+    ----------
+    x_log10 : np.ndarray
+        log10-transformed measured intensities (x axis).
+    y_log10 : np.ndarray
+        log10-transformed calibrated intensities (y axis).
+    slope : float
+        Slope of the log–log linear fit.
+    intercept : float
+        Intercept of the log–log linear fit.
+
+    Returns
+    -------
+    dict[str, Any]
+        Plain figure dictionary ready to be stored in a ``dcc.Store``.
+    """
+    return build_calibration_figure(
+        x_log10=x_log10,
+        y_log10=y_log10,
+        slope=slope,
+        intercept=intercept,
+    ).to_dict()
+
+
 def compute_valid_event_count_for_preview(
     *,
     bead_file_path: str,
@@ -832,7 +942,7 @@ def run_calibration_workflow(
         fit_result=fit_result,
     )
 
-    figure = build_calibration_figure(
+    figure_store = build_calibration_figure_store(
         x_log10=fit_result.intensity_au_log10,
         y_log10=fit_result.intensity_calibrated_units_log10,
         slope=fit_result.slope,
@@ -876,7 +986,7 @@ def run_calibration_workflow(
     )
 
     result = CalibrationResult(
-        figure_store=figure.to_dict(),
+        figure_store=figure_store,
         calibration_store=calibration_payload,
         slope_out=f"{float(fit_result.slope):.6g}",
         intercept_out=f"{float(fit_result.intercept):.6g} (A={float(fit_result.prefactor):.6g})",
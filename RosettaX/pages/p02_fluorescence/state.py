@@ -22,7 +22,7 @@ def build_empty_peak_lines_payload() -> dict[str, list[Any]]:
     }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FluorescencePageState:
     """
     Single source of truth for the fluorescence calibration page.
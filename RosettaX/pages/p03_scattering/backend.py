@@ -7,12 +7,25 @@ from functools import lru_cache
 from typing import Any, Callable, Optional
 
 import numpy as np
-from PyMieSim import experiment as PyMieSim
-from PyMieSim.units import ureg
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _load_pymiesim() -> tuple[Any, Any]:
+    """
+    Import PyMieSim on first use.
+
+    PyMieSim pulls in matplotlib and its unit registry, which dominates the
+    application start up time, so it is only loaded once a scattering
+    computation actually runs.
+    """
+    from PyMieSim import experiment
+    from PyMieSim.units import ureg
+
+    return experiment, ureg
+
+
 SOLID_SPHERE_MODEL_NAME = "Solid Sphere"
 CORE_SHELL_SPHERE_MODEL_NAME = "Core/Shell Sphere"
 
@@ -440,6 +453,8 @@ class BackEnd:
         """
         Cache solid-sphere coupling computations for deterministic inputs.
         """
+        PyMieSim, ureg = _load_pymiesim()
+
         particle_diameter_array = np.asarray(particle_diameters_nm, dtype=float)
 
         def build_solid_sphere_scatterer_set() -> Any:
@@ -501,6 +516,8 @@ class BackEnd:
         """
         Cache solid-sphere Csca computations converted from m^2 to nm^2.
         """
+        PyMieSim, ureg = _load_pymiesim()
+
         target_size = len(particle_diameters_nm)
         particle_diameter_array = np.asarray(particle_diameters_nm, dtype=float)
 
@@ -759,6 +776,8 @@ class BackEnd:
         """
         Cache row-wise core-shell coupling computations for deterministic inputs.
         """
+        PyMieSim, ureg = _load_pymiesim()
+
         expected_coupling_values: list[float] = []
 
         for row_index, (core_diameter_nm, shell_thickness_nm) in enumerate(
@@ -845,6 +864,8 @@ class BackEnd:
         """
         Cache paired core-shell Csca computations converted from m^2 to nm^2.
         """
+        PyMieSim, ureg = _load_pymiesim()
+
         target_size = len(core_diameters_nm)
 
         polarization_set = PyMieSim.polarization_set.PolarizationSet(
@@ -956,6 +977,8 @@ class BackEnd:
         """
         Compute weighted solid-sphere coupling values with sequential sets.
         """
+        PyMieSim, ureg = _load_pymiesim()
+
         target_size = int(particle_diameter_array.size)
 
         polarization_set = PyMieSim.polarization_set.PolarizationSet(
@@ -1022,6 +1045,8 @@ class BackEnd:
         """
         Compute one weighted core-shell coupling value with sequential sets.
         """
+        PyMieSim, ureg = _load_pymiesim()
+
         polarization_set = PyMieSim.polarization_set.PolarizationSet(
             angles=[float(polarization_angle_degree)] * ureg.degree,
         )
@@ -1083,6 +1108,8 @@ class BackEnd:
         """
         Build the PyMieSim experiment and return processed coupling values.
         """
+        PyMieSim, ureg = _load_pymiesim()
+
         logger.debug("Building PolarizationSet with sampling=%r.", detector_sampling)
 
         polarization_set = PyMieSim.polarization_set.PolarizationSet(
@@ -6,7 +6,7 @@ from RosettaX.workflow.upload.ids import UploadIds as UploadSectionIds
 from RosettaX.workflow.save.ids import SaveIds as SaveSectionIds
 from RosettaX.workflow.peak.ids import PeakIds
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParameterSectionIds:
     """
     ID factory for the scattering parameter section.
@@ -14,10 +14,6 @@ class ParameterSectionIds:
 
     prefix: str
 
-    @property
-    def collapse_example(self) -> str:
-        return f"{self.prefix}-parameters-collapse"
-
     @property
     def mie_model(self) -> str:
         return f"{self.prefix}-mie-model"
@@ -147,7 +143,7 @@ class ParameterSectionIds:
         return f"{self.prefix}-particle-configuration-custom-values-container"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CalibrationSectionIds:
     """
     ID factory for the scattering calibration section.
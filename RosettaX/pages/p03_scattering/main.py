@@ -1,8 +1,13 @@
 # -*- coding: utf-8 -*-
+from typing import Any, Optional
+
 import dash
 
+from RosettaX.utils.runtime_config import RuntimeConfig
+from RosettaX.workflow.calibration_cards import register_section_callbacks
+from RosettaX.workflow.detector import get_default_detector_preset_loader
+
 from .ids import Ids
-from .sections import callbacks as section_callbacks
 from .sections import layout as section_layout
 from .sections import services as section_services
 
@@ -24,6 +29,8 @@ class ScatterCalibrationPage:
 
         self.sections = section_services.build_sections(self)
 
+        self._layout_cache: Optional[tuple[Any, dash.html.Div]] = None
+
     def register_callbacks(self) -> "ScatterCalibrationPage":
         """
         Register all section callbacks.
@@ -33,19 +40,33 @@ class ScatterCalibrationPage:
         ScatterCalibrationPage
             Current page instance.
         """
-        section_callbacks.register_callbacks(self.sections)
+        register_section_callbacks(self.sections)
         return self
 
     def layout(self) -> dash.html.Div:
         """
         Build the scattering calibration page layout.
 
+        The layout only depends on the startup default profile and the detector
+        preset files, so the built tree is reused until one of them changes.
+
         Returns
         -------
         dash.html.Div
             Page layout.
         """
-        return section_layout.build_page_layout(self, self.sections)
+        layout_signature = (
+            RuntimeConfig.default_profile_signature(),
+            get_default_detector_preset_loader().preset_signature(),
+        )
+
+        if self._layout_cache is None or self._layout_cache[0] != layout_signature:
+            self._layout_cache = (
+                layout_signature,
+                section_layout.build_page_layout(self, self.sections),
+            )
+
+        return self._layout_cache[1]
 
 
 _page = ScatterCalibrationPage().register_callbacks()
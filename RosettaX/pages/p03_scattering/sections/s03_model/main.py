@@ -98,7 +98,7 @@ class Model:
         return dbc.Card(
             [
                 self._build_header(),
-                self._build_collapse(),
+                self._build_body(),
             ],
             style=ui_forms.build_workflow_section_card_style(
                 color_name=self.card_color,
@@ -126,16 +126,6 @@ class Model:
             title_style_overrides=SECTION_TITLE_STYLE_OVERRIDES,
         )
 
-    def _build_collapse(self) -> dbc.Collapse:
-        """
-        Build collapsible parameter body.
-        """
-        return dbc.Collapse(
-            self._build_body(),
-            id=self.ids.collapse_example,
-            is_open=True,
-        )
-
     def _build_body(self) -> dbc.CardBody:
         """
         Build parameter body.
@@ -1304,94 +1294,56 @@ class Model:
     def _register_refractive_index_callbacks(self) -> None:
         """
         Register refractive index preset callbacks.
-        """
-
-        @dash.callback(
-            dash.Output(
-                self.ids.medium_refractive_index_custom,
-                "value",
-                allow_duplicate=True,
-            ),
-            dash.Input(self.ids.medium_refractive_index_source, "value"),
-            dash.Input(self.ids.wavelength_nm, "value"),
-            dash.State(self.ids.medium_refractive_index_custom, "value"),
-            prevent_initial_call=True,
-        )
-        def apply_medium_preset(
-            preset_value: Any,
-            wavelength_nm: Any,
-            current_value: Any,
-        ) -> Any:
-            return self.model_configuration.apply_refractive_index_preset(
-                preset_value=preset_value,
-                wavelength_nm=wavelength_nm,
-                current_value=current_value,
-            )
 
-        @dash.callback(
-            dash.Output(
-                self.ids.particle_refractive_index_custom,
-                "value",
-                allow_duplicate=True,
-            ),
-            dash.Input(self.ids.particle_refractive_index_source, "value"),
-            dash.Input(self.ids.wavelength_nm, "value"),
-            dash.State(self.ids.particle_refractive_index_custom, "value"),
-            prevent_initial_call=True,
-        )
-        def apply_particle_preset(
-            preset_value: Any,
-            wavelength_nm: Any,
-            current_value: Any,
-        ) -> Any:
-            return self.model_configuration.apply_refractive_index_preset(
-                preset_value=preset_value,
-                wavelength_nm=wavelength_nm,
-                current_value=current_value,
-            )
-
-        @dash.callback(
-            dash.Output(
-                self.ids.core_refractive_index_custom,
-                "value",
-                allow_duplicate=True,
-            ),
-            dash.Input(self.ids.core_refractive_index_source, "value"),
-            dash.Input(self.ids.wavelength_nm, "value"),
-            dash.State(self.ids.core_refractive_index_custom, "value"),
-            prevent_initial_call=True,
+        The medium, particle, core, and shell pickers share one callback, so a
+        wavelength edit re-resolves every preset in a single request.
+        """
+        refractive_index_fields = (
+            (self.ids.medium_refractive_index_source, self.ids.medium_refractive_index_custom),
+            (self.ids.particle_refractive_index_source, self.ids.particle_refractive_index_custom),
+            (self.ids.core_refractive_index_source, self.ids.core_refractive_index_custom),
+            (self.ids.shell_refractive_index_source, self.ids.shell_refractive_index_custom),
         )
-        def apply_core_preset(
-            preset_value: Any,
-            wavelength_nm: Any,
-            current_value: Any,
-        ) -> Any:
-            return self.model_configuration.apply_refractive_index_preset(
-                preset_value=preset_value,
-                wavelength_nm=wavelength_nm,
-                current_value=current_value,
-            )
+        field_count = len(refractive_index_fields)
 
         @dash.callback(
-            dash.Output(
-                self.ids.shell_refractive_index_custom,
-                "value",
-                allow_duplicate=True,
-            ),
-            dash.Input(self.ids.shell_refractive_index_source, "value"),
+            *[
+                dash.Output(custom_id, "value", allow_duplicate=True)
+                for _source_id, custom_id in refractive_index_fields
+            ],
+            *[
+                dash.Input(source_id, "value")
+                for source_id, _custom_id in refractive_index_fields
+            ],
             dash.Input(self.ids.wavelength_nm, "value"),
-            dash.State(self.ids.shell_refractive_index_custom, "value"),
+            *[
+                dash.State(custom_id, "value")
+                for _source_id, custom_id in refractive_index_fields
+            ],
             prevent_initial_call=True,
         )
-        def apply_shell_preset(
-            preset_value: Any,
-            wavelength_nm: Any,
-            current_value: Any,
-        ) -> Any:
-            return self.model_configuration.apply_refractive_index_preset(
-                preset_value=preset_value,
-                wavelength_nm=wavelength_nm,
-                current_value=current_value,
+        def apply_refractive_index_presets(*callback_values: Any) -> tuple[Any, ...]:
+            preset_values = callback_values[:field_count]
+            wavelength_nm = callback_values[field_count]
+            current_values = callback_values[field_count + 1:]
+            # Runtime profile sync can set several preset sources at once, so
+            # every triggered input is considered, not only the first.
+            triggered_ids = set(dash.ctx.triggered_prop_ids.values())
+            wavelength_changed = self.ids.wavelength_nm in triggered_ids
+
+            return tuple(
+                self.model_configuration.apply_refractive_index_preset(
+                    preset_value=preset_value,
+                    wavelength_nm=wavelength_nm,
+                    current_value=current_value,
+                )
+                if wavelength_changed or source_id in triggered_ids
+                else dash.no_update
+                for (source_id, _custom_id), preset_value, current_value in zip(
+                    refractive_index_fields,
+                    preset_values,
+                    current_values,
+                )
             )
 
     def _register_detector_configuration_callbacks(self) -> None:
@@ -1914,7 +1866,8 @@ class Model:
             dash.Input(self.ids.detector_gamma_angle_degree, "value"),
             dash.Input(self.ids.detector_sampling, "value"),
             dash.Input(self.ids.detector_configuration_preset, "value"),
-            dash.Input(self.ids.detector_angular_weighting_json, "value"),
+            dash.Input(self.ids.detector_angular_weighting_json, "n_blur"),
+            dash.State(self.ids.detector_angular_weighting_json, "value"),
             dash.State(self.ids.optical_configuration_preview, "relayoutData"),
             prevent_initial_call=False,
         )
@@ -1927,9 +1880,12 @@ class Model:
             detector_gamma_angle_degree: Any,
             detector_sampling: Any,
             detector_configuration_preset: Any,
+            detector_angular_weighting_blur_count: Any,
             detector_angular_weighting_json: Any,
             relayout_data: Any,
         ):
+            del detector_angular_weighting_blur_count
+
             logger.debug(
                 "update_optical_configuration_preview called with "
                 "detector_numerical_aperture=%r detector_cache_numerical_aperture=%r "
@@ -1969,7 +1925,7 @@ class Model:
             dash.Output(self.ids.detector_angular_weighting_alert, "children"),
             dash.Output(self.ids.detector_angular_weighting_alert, "is_open"),
             dash.Output(self.ids.detector_angular_weighting_alert, "color"),
-            dash.Input(self.ids.detector_angular_weighting_json, "value"),
+            dash.Input(self.ids.detector_angular_weighting_json, "n_blur"),
             dash.Input(self.ids.detector_configuration_preset, "value"),
             dash.Input(self.ids.detector_numerical_aperture, "value"),
             dash.Input(self.ids.detector_cache_numerical_aperture, "value"),
@@ -1978,10 +1934,11 @@ class Model:
             dash.Input(self.ids.detector_phi_angle_degree, "value"),
             dash.Input(self.ids.detector_gamma_angle_degree, "value"),
             dash.Input(self.ids.detector_sampling, "value"),
+            dash.State(self.ids.detector_angular_weighting_json, "value"),
             prevent_initial_call=False,
         )
         def validate_detector_angular_weighting_json(
-            detector_angular_weighting_json: Any,
+            detector_angular_weighting_blur_count: Any,
             detector_configuration_preset: Any,
             detector_numerical_aperture: Any,
             detector_cache_numerical_aperture: Any,
@@ -1990,7 +1947,10 @@ class Model:
             detector_phi_angle_degree: Any,
             detector_gamma_angle_degree: Any,
             detector_sampling: Any,
+            detector_angular_weighting_json: Any,
         ) -> tuple[str, bool, str]:
+            del detector_angular_weighting_blur_count
+
             if (
                 str(detector_configuration_preset or "").strip()
                 != self.model_configuration.custom_detector_preset_name
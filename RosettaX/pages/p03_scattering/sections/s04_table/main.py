@@ -66,8 +66,6 @@ class ReferenceTable:
         self.description_tooltip_id = f"{self.ids.bead_table}-description-tooltip"
         self.description_tooltip_target_id = f"{self.ids.bead_table}-description-tooltip-target"
 
-        self.compute_model_tooltip_id = f"{self.ids.compute_model_btn}-info-tooltip"
-        self.compute_model_tooltip_target_id = f"{self.ids.compute_model_btn}-info-target"
         self.model_section = ScatteringModelSection(
             page=page,
             section_number=section_number,
@@ -88,7 +86,11 @@ class ReferenceTable:
         self.action_config = ReferenceTableActionConfig(
             button_id=self.ids.compute_model_btn,
             button_label="Compute model",
-            description=self._build_compute_model_description(),
+            description=(
+                "This step fills the modeled coupling column for the "
+                "calibration standard using the current optical and particle "
+                "parameters."
+            ),
             button_color="primary",
             button_style={
                 "marginTop": "12px",
@@ -162,33 +164,6 @@ class ReferenceTable:
             ),
         )
 
-    def _build_compute_model_description(self) -> dash.html.Div:
-        """
-        Build the compute model action help as a compact hover tooltip.
-        """
-        return dash.html.Div(
-            [
-                ui_forms.build_info_badge(
-                    tooltip_target_id=self.compute_model_tooltip_target_id,
-                ),
-                dbc.Tooltip(
-                    (
-                        "This step fills the modeled coupling column for the "
-                        "calibration standard using the current optical and particle "
-                        "parameters."
-                    ),
-                    id=self.compute_model_tooltip_id,
-                    target=self.compute_model_tooltip_target_id,
-                    placement="right",
-                ),
-            ],
-            style={
-                "display": "inline-flex",
-                "alignItems": "center",
-                "marginLeft": "8px",
-            },
-        )
-
     def _build_default_table_state(self) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
         """
         Build initial table columns and rows from the default runtime profile.
@@ -558,6 +558,29 @@ class Calibration:
 
         return figure
 
+    def _patch_axis_scales(
+        self,
+        *,
+        x_log_value: Any,
+        y_log_value: Any,
+    ) -> dash.Patch:
+        """
+        Build a partial figure update that only switches the axis scales.
+
+        Toggling a log switch leaves the stored traces untouched, so only the
+        axis types are sent to the browser instead of the whole figure.
+        """
+        patched_figure = dash.Patch()
+
+        patched_figure["layout"]["xaxis"]["type"] = self._axis_type_from_toggle(
+            x_log_value,
+        )
+        patched_figure["layout"]["yaxis"]["type"] = self._axis_type_from_toggle(
+            y_log_value,
+        )
+
+        return patched_figure
+
     def _resolve_calibration_detector_column(
         self,
         *,
@@ -833,13 +856,22 @@ class Calibration:
             x_log_value: Any,
             y_log_value: Any,
             runtime_config_data: Any,
-        ) -> go.Figure:
+        ) -> go.Figure | dash.Patch:
             page_state = ScatteringPageState.from_dict(
                 page_state_payload if isinstance(page_state_payload, dict) else None
             )
 
             stored_figure = page_state.calibration_graph_payload
 
+            if stored_figure and dash.ctx.triggered_id in (
+                self.ids.instrument_response_x_log_switch,
+                self.ids.instrument_response_y_log_switch,
+            ):
+                return self._patch_axis_scales(
+                    x_log_value=x_log_value,
+                    y_log_value=y_log_value,
+                )
+
             logger.debug(
                 "update_left_graph called with stored_figure_type=%s x_log_value=%r y_log_value=%r",
                 type(stored_figure).__name__,
@@ -897,13 +929,22 @@ class Calibration:
             x_log_value: Any,
             y_log_value: Any,
             runtime_config_data: Any,
-        ) -> go.Figure:
+        ) -> go.Figure | dash.Patch:
             page_state = ScatteringPageState.from_dict(
                 page_state_payload if isinstance(page_state_payload, dict) else None
             )
 
             stored_figure = page_state.calibration_model_graph_payload
 
+            if stored_figure and dash.ctx.triggered_id in (
+                self.ids.mie_relation_x_log_switch,
+                self.ids.mie_relation_y_log_switch,
+            ):
+                return self._patch_axis_scales(
+                    x_log_value=x_log_value,
+                    y_log_value=y_log_value,
+                )
+
             logger.debug(
                 "update_right_graph called with stored_figure_type=%s x_log_value=%r y_log_value=%r",
                 type(stored_figure).__name__,
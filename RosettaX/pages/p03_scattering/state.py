@@ -4,7 +4,7 @@ from dataclasses import asdict, dataclass
 from typing import Any, Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScatteringPageState:
     """
     Single source of truth for the scattering calibration page.
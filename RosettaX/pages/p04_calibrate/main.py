@@ -1,14 +1,15 @@
 # -*- coding: utf-8 -*-
 
-from typing import Self
+from typing import Any, Optional, Self
 
 import dash
 import dash_bootstrap_components as dbc
 
 from RosettaX.utils import styling
+from RosettaX.utils.runtime_config import RuntimeConfig
+from RosettaX.workflow.calibration_cards import register_section_callbacks
 
 from .ids import Ids
-from .sections import callbacks as section_callbacks
 from .sections import layout as section_layout
 from .sections import services as section_services
 
@@ -54,6 +55,8 @@ class ApplyCalibrationPage:
 
         self.sections = section_services.build_sections(self)
 
+        self._layout_cache: Optional[tuple[Any, dbc.Container]] = None
+
     def register_callbacks(self) -> Self:
         """
         Register all section callbacks.
@@ -63,19 +66,30 @@ class ApplyCalibrationPage:
         Self
             Current page instance.
         """
-        section_callbacks.register_callbacks(self.sections)
+        register_section_callbacks(self.sections)
         return self
 
     def layout(self, **_kwargs) -> dbc.Container:
         """
         Build the apply calibration page layout.
 
+        The layout only depends on the startup default profile, so the built
+        tree is reused until one of the default profile files changes.
+
         Returns
         -------
         dbc.Container
             Page layout.
         """
-        return section_layout.build_page_layout(self, self.sections)
+        profile_signature = RuntimeConfig.default_profile_signature()
+
+        if self._layout_cache is None or self._layout_cache[0] != profile_signature:
+            self._layout_cache = (
+                profile_signature,
+                section_layout.build_page_layout(self, self.sections),
+            )
+
+        return self._layout_cache[1]
 
 
 _page = ApplyCalibrationPage().register_callbacks()
@@ -3,7 +3,7 @@
 import dash_bootstrap_components as dbc
 from dash import dcc
 
-from RosettaX.workflow.calibration_cards import build_collapsible_section_layout
+from RosettaX.workflow.calibration_cards import build_collapsible_section_layouts
 
 from ..state import ApplyCalibrationPageState
 
@@ -20,13 +20,10 @@ def build_page_layout(page, sections) -> dbc.Container:
             ),
             *_build_stores(page),
             dbc.Container(
-                [
-                    build_collapsible_section_layout(
-                        section,
-                        page_name="apply_calibration",
-                    )
-                    for section in sections
-                ],
+                build_collapsible_section_layouts(
+                    sections,
+                    page_name="apply_calibration",
+                ),
                 fluid=True,
                 style={
                     "display": "flex",
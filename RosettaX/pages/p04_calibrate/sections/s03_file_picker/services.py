@@ -21,6 +21,7 @@ from RosettaX.utils.streamed_uploads import (
 from RosettaX.utils.upload_limits import format_upload_size, get_max_upload_bytes
 from RosettaX.workflow.apply_calibration.fluorescence import apply_legacy_calibration_to_series
 from RosettaX.workflow.apply_calibration.io import resolve_uploaded_fcs_paths
+from RosettaX.workflow.peak.core.detectors import read_detector_header
 from RosettaX.workflow.plotting.scatter2d import Scatter2DGraph
 from RosettaX.pages.p04_calibrate.sections.s02_calibration_picker import services as calibration_picker_services
 
@@ -392,14 +393,15 @@ def build_preview_channel_selection(
         return [], None
 
     try:
-        with FCSFile(selected_path) as fcs_file:
-            channel_names = [
-                str(name) for name in fcs_file.get_column_names() if str(name).strip()
-            ]
+        column_names, _metadata = read_detector_header(selected_path)
     except Exception:
         logger.exception("Failed to read preview channels from selected_path=%r", selected_path)
         return [], None
 
+    channel_names = [
+        str(name) for name in column_names if str(name).strip()
+    ]
+
     affected_source_channels = _resolve_preview_source_channels(selected_calibration_summary)
 
     if affected_source_channels:
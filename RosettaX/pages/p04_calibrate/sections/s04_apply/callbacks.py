@@ -249,6 +249,9 @@ class ApplyCallbacks:
             target_core_shell_core_diameter_max_nm: Any,
             target_core_shell_core_diameter_count: Any,
         ) -> tuple:
+            if not n_clicks:
+                return dash.no_update, dash.no_update, dash.no_update
+
             logger.debug(
                 "apply_and_export_calibration called with n_clicks=%r "
                 "page_state_data=%r "
@@ -701,6 +704,9 @@ class ApplyCallbacks:
             target_core_shell_core_diameter_max_nm: Any,
             target_core_shell_core_diameter_count: Any,
         ) -> tuple:
+            if not n_clicks:
+                return dash.no_update, dash.no_update
+
             del n_clicks
 
             page_state = ApplyCalibrationPageState.from_dict(
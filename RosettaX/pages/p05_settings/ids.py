@@ -1,9 +1,20 @@
 # -*- coding: utf-8 -*-
 
+from typing import Any
+
+from dash import MATCH
+
 
 PAGE_NAME = "settings"
 
 
+def _section_value(section_key: Any) -> Any:
+    """
+    Stringify concrete section keys while keeping the MATCH wildcard intact.
+    """
+    return section_key if section_key is MATCH else str(section_key)
+
+
 class Ids:
     """
     ID namespace for the settings page.
@@ -120,24 +131,24 @@ class Ids:
         collapse_calibration_cards = f"{PAGE_NAME}-collapse-calibration-cards"
 
         @staticmethod
-        def section_toggle_target(section_key: str) -> dict[str, str]:
+        def section_toggle_target(section_key: Any) -> dict[str, Any]:
             return {
                 "type": f"{PAGE_NAME}-default-section-toggle-target",
-                "section": str(section_key),
+                "section": _section_value(section_key),
             }
 
         @staticmethod
-        def section_collapse(section_key: str) -> dict[str, str]:
+        def section_collapse(section_key: Any) -> dict[str, Any]:
             return {
                 "type": f"{PAGE_NAME}-default-section-collapse",
-                "section": str(section_key),
+                "section": _section_value(section_key),
             }
 
         @staticmethod
-        def section_toggle_label(section_key: str) -> dict[str, str]:
+        def section_toggle_label(section_key: Any) -> dict[str, Any]:
             return {
                 "type": f"{PAGE_NAME}-default-section-toggle-label",
-                "section": str(section_key),
+                "section": _section_value(section_key),
             }
 
     class NewProfile:
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+from typing import Any, Optional
+
 import dash
 import dash_bootstrap_components as dbc
 
@@ -8,6 +10,7 @@ from .ids import Ids
 from .state import SettingsPageState
 from RosettaX.ui import WorkflowStep, build_workflow_page_header
 from RosettaX.utils import styling
+from RosettaX.utils.browser_profiles import BrowserProfileLibrary
 
 
 class SettingsPage:
@@ -27,13 +30,32 @@ class SettingsPage:
 
         self.backend = None
 
+        self._layout_cache: Optional[tuple[Any, dash.html.Div]] = None
+
     def register_callbacks(self) -> "SettingsPage":
         for section in self.sections:
             section.register_callbacks()
 
         return self
 
-    def layout(self) -> dash.html.Div:
+    def layout(self, **_kwargs) -> dash.html.Div:
+        """
+        Build the settings page layout.
+
+        The layout only depends on the packaged and default profile files, so
+        the built tree is reused until one of them changes.
+        """
+        profile_signature = BrowserProfileLibrary.seed_data_signature()
+
+        if self._layout_cache is None or self._layout_cache[0] != profile_signature:
+            self._layout_cache = (
+                profile_signature,
+                self._build_layout(),
+            )
+
+        return self._layout_cache[1]
+
+    def _build_layout(self) -> dash.html.Div:
         return dash.html.Div(
             [
                 dash.dcc.Store(
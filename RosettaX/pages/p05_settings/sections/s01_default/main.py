@@ -5,9 +5,13 @@ from typing import Any, Optional
 
 import dash
 import dash_bootstrap_components as dbc
-from dash import Input, Output, State, callback, html
+from dash import MATCH, Input, Output, State, callback, html
 
-from RosettaX.utils.browser_profiles import BROWSER_PROFILES_STORE_ID
+from RosettaX.utils.browser_profiles import (
+    BROWSER_PROFILES_STORE_ID,
+    DEFAULT_PROFILE_FILENAME,
+    BrowserProfileLibrary,
+)
 from RosettaX.utils import styling, ui_forms
 from RosettaX.utils.runtime_config import RuntimeConfig
 
@@ -56,11 +60,17 @@ class DefaultProfile:
         """
         logger.debug("DefaultProfile.get_layout rebuilding settings page.")
 
-        form_store_data = self._build_initial_form_store_data()
+        browser_profiles = BrowserProfileLibrary.from_seed_data()
+
+        form_store_data = self._build_initial_form_store_data(
+            browser_profiles,
+        )
 
         return html.Div(
             [
-                self._build_profile_controls_card(),
+                self._build_profile_controls_card(
+                    browser_profiles,
+                ),
                 self._build_settings_sections_stack(
                     form_store_data=form_store_data,
                 ),
@@ -73,11 +83,14 @@ class DefaultProfile:
             },
         )
 
-    def _build_profile_controls_card(self) -> dbc.Card:
+    def _build_profile_controls_card(
+        self,
+        browser_profiles: BrowserProfileLibrary,
+    ) -> dbc.Card:
         """
         Build saved profile selection card.
         """
-        profile_options = services.build_profile_options()
+        profile_options = browser_profiles.build_options()
 
         default_profile_value = services.resolve_default_profile_value(
             profile_options,
@@ -402,6 +415,10 @@ class DefaultProfile:
     ) -> html.Div:
         """
         Build one compact stacked field.
+
+        The form renders one of these per schema field, so the label and
+        wrapper are styled by ``assets/settings_form.css`` rather than by
+        repeating the same inline style dict on every row.
         """
         field_definition = schema.FIELD_DEFINITION_BY_NAME[field_name]
 
@@ -410,13 +427,7 @@ class DefaultProfile:
                 html.Label(
                     field_definition.label,
                     htmlFor=field_ids[field_name],
-                    style={
-                        "display": "block",
-                        "fontSize": "0.86rem",
-                        "fontWeight": "600",
-                        "marginBottom": "5px",
-                        "opacity": 0.86,
-                    },
+                    className="settings-field-label",
                 ),
                 self._build_field_component(
                     field_definition=field_definition,
@@ -424,9 +435,7 @@ class DefaultProfile:
                     value=form_store_data.get(field_name),
                 ),
             ],
-            style={
-                "minWidth": "0",
-            },
+            className="settings-field",
         )
 
     def _build_field_component(
@@ -632,11 +641,22 @@ class DefaultProfile:
         """
         return schema.ordered_field_names()
 
-    def _build_initial_form_store_data(self) -> dict[str, Any]:
+    def _build_initial_form_store_data(
+        self,
+        browser_profiles: BrowserProfileLibrary,
+    ) -> dict[str, Any]:
         """
         Build initial form data from the default runtime profile.
+
+        The seeded profile library already holds the parsed default profile,
+        so the layout reads it from there instead of parsing the file again.
         """
-        runtime_config = RuntimeConfig.from_default_profile()
+        default_profile_payload = browser_profiles.profiles.get(DEFAULT_PROFILE_FILENAME)
+
+        if default_profile_payload is None:
+            runtime_config = RuntimeConfig.from_default_profile()
+        else:
+            runtime_config = RuntimeConfig.from_dict(default_profile_payload)
 
         return services.build_form_store_from_runtime_config(
             runtime_config,
@@ -953,24 +973,25 @@ class DefaultProfile:
         def clear_save_confirmation(*_args):
             return "", False
 
-        for section_key, _section_title in schema.PROFILE_SECTION_ORDER:
-            @callback(
-                Output(self.ids.section_collapse(section_key), "is_open"),
-                Output(self.ids.section_toggle_label(section_key), "children"),
-                Input(self.ids.section_toggle_target(section_key), "n_clicks"),
-                State(self.ids.section_collapse(section_key), "is_open"),
-                prevent_initial_call=True,
+        @callback(
+            Output(self.ids.section_collapse(MATCH), "is_open"),
+            Output(self.ids.section_toggle_label(MATCH), "children"),
+            Input(self.ids.section_toggle_target(MATCH), "n_clicks"),
+            State(self.ids.section_collapse(MATCH), "is_open"),
+            State(self.ids.section_collapse(MATCH), "id"),
+            prevent_initial_call=True,
+        )
+        def toggle_settings_section(
+            n_clicks: Any,
+            is_open: Any,
+            collapse_id: Any,
+        ) -> tuple[bool, str]:
+            if not n_clicks:
+                section_key = collapse_id.get("section") if isinstance(collapse_id, dict) else None
+                next_is_open = not self.collapsed_sections.get(section_key, False)
+            else:
+                next_is_open = not bool(is_open)
+
+            return next_is_open, self._build_collapse_button_children(
+                is_open=next_is_open,
             )
-            def toggle_settings_section(
-                n_clicks: Any,
-                is_open: Any,
-                _section_key: str = section_key,
-            ) -> tuple[bool, str]:
-                if not n_clicks:
-                    next_is_open = not self.collapsed_sections.get(_section_key, False)
-                else:
-                    next_is_open = not bool(is_open)
-
-                return next_is_open, self._build_collapse_button_children(
-                    is_open=next_is_open,
-                )
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+from typing import Optional
+
 import dash
 import dash_bootstrap_components as dbc
 from dash import html
@@ -7,6 +9,37 @@ from dash import html
 from RosettaX.utils import ui_forms
 
 
+_CARD_TITLE_STYLE = {
+    "fontWeight": "750",
+    "fontSize": "1.02rem",
+}
+
+_CARD_BODY_STYLE = {
+    "padding": "16px",
+}
+
+_FULL_HEIGHT_CARD_STYLE = {
+    "height": "100%",
+}
+
+_STACK_STYLE = {
+    "display": "flex",
+    "flexDirection": "column",
+    "gap": "10px",
+}
+
+_ITEM_TITLE_STYLE = {
+    "fontWeight": "700",
+    "fontSize": "0.92rem",
+    "marginBottom": "3px",
+}
+
+_ITEM_DESCRIPTION_STYLE = {
+    "fontSize": "0.88rem",
+    "opacity": 0.74,
+}
+
+
 class HelpPage:
     """
     Help page for RosettaX.
@@ -31,6 +64,8 @@ class HelpPage:
         self.support_url = "https://github.com/sponsors/MartinPdeS"
         self.contact_email = "martin.poinsinet.de.sivry@gmail.com"
 
+        self._layout_cache: Optional[dbc.Container] = None
+
     def _id(
         self,
         name: str,
@@ -41,34 +76,30 @@ class HelpPage:
         self,
         **_kwargs,
     ) -> dbc.Container:
+        """
+        Return the help page layout.
+
+        The help page is fully static, so the component tree is built on the
+        first call and the same instance is returned afterwards.
+        """
+        if self._layout_cache is None:
+            self._layout_cache = self._build_layout()
+
+        return self._layout_cache
+
+    def _build_layout(self) -> dbc.Container:
         return dbc.Container(
-            [
+            (
                 self._hero_section(),
-                html.Div(
-                    style={
-                        "height": "18px",
-                    },
-                ),
+                ui_forms.SECTION_SPACER,
                 self._project_resources_card(),
-                html.Div(
-                    style={
-                        "height": "18px",
-                    },
-                ),
+                ui_forms.SECTION_SPACER,
                 self._support_scope_row(),
-                html.Div(
-                    style={
-                        "height": "18px",
-                    },
-                ),
+                ui_forms.SECTION_SPACER,
                 self._troubleshooting_card(),
-                html.Div(
-                    style={
-                        "height": "18px",
-                    },
-                ),
+                ui_forms.SECTION_SPACER,
                 self._diagnostics_card(),
-            ],
+            ),
             fluid=True,
             style={
                 "paddingLeft": "0px",
@@ -128,10 +159,7 @@ class HelpPage:
                     [
                         html.Div(
                             "Project resources",
-                            style={
-                                "fontWeight": "750",
-                                "fontSize": "1.02rem",
-                            },
+                            style=_CARD_TITLE_STYLE,
                         ),
                         html.Div(
                             "Documentation, source code, package links, and project support.",
@@ -142,7 +170,7 @@ class HelpPage:
                 dbc.CardBody(
                     [
                         dbc.Row(
-                            [
+                            (
                                 dbc.Col(
                                     dbc.Button(
                                         "Technical docs",
@@ -200,7 +228,7 @@ class HelpPage:
                                     ),
                                     md=3,
                                 ),
-                            ],
+                            ),
                             className="g-2",
                             style={"alignItems": "center"},
                         ),
@@ -223,7 +251,7 @@ class HelpPage:
                             },
                         ),
                     ],
-                    style={"padding": "16px"},
+                    style=_CARD_BODY_STYLE,
                 ),
             ]
         )
@@ -239,7 +267,7 @@ class HelpPage:
         Build support scope cards.
         """
         return dbc.Row(
-            [
+            (
                 dbc.Col(
                     self._getting_started_card(),
                     lg=4,
@@ -252,7 +280,7 @@ class HelpPage:
                     self._before_debugging_card(),
                     lg=4,
                 ),
-            ],
+            ),
             className="g-3",
         )
 
@@ -266,10 +294,7 @@ class HelpPage:
                     [
                         html.Div(
                             "Getting started",
-                            style={
-                                "fontWeight": "750",
-                                "fontSize": "1.02rem",
-                            },
+                            style=_CARD_TITLE_STYLE,
                         ),
                         html.Div(
                             "Use Help for first-run orientation. Use Documentation for internals.",
@@ -305,11 +330,7 @@ class HelpPage:
                                     ),
                                 ),
                             ],
-                            style={
-                                "display": "flex",
-                                "flexDirection": "column",
-                                "gap": "10px",
-                            },
+                            style=_STACK_STYLE,
                         ),
                         html.Hr(
                             style={
@@ -339,14 +360,10 @@ class HelpPage:
                             target="_self",
                         ),
                     ],
-                    style={
-                        "padding": "16px",
-                    },
+                    style=_CARD_BODY_STYLE,
                 ),
             ],
-            style={
-                "height": "100%",
-            },
+            style=_FULL_HEIGHT_CARD_STYLE,
         )
 
         return ui_forms.apply_workflow_section_card_style(
@@ -365,10 +382,7 @@ class HelpPage:
                     [
                         html.Div(
                             "When to use Help",
-                            style={
-                                "fontWeight": "750",
-                                "fontSize": "1.02rem",
-                            },
+                            style=_CARD_TITLE_STYLE,
                         ),
                         html.Div(
                             "This page is for first-run orientation and diagnosis, not deep technical reference.",
@@ -405,21 +419,13 @@ class HelpPage:
                                     ),
                                 ),
                             ],
-                            style={
-                                "display": "flex",
-                                "flexDirection": "column",
-                                "gap": "10px",
-                            },
+                            style=_STACK_STYLE,
                         ),
                     ],
-                    style={
-                        "padding": "16px",
-                    },
+                    style=_CARD_BODY_STYLE,
                 ),
             ],
-            style={
-                "height": "100%",
-            },
+            style=_FULL_HEIGHT_CARD_STYLE,
         )
 
         return ui_forms.apply_workflow_section_card_style(
@@ -438,10 +444,7 @@ class HelpPage:
                     [
                         html.Div(
                             "Before digging deeper",
-                            style={
-                                "fontWeight": "750",
-                                "fontSize": "1.02rem",
-                            },
+                            style=_CARD_TITLE_STYLE,
                         ),
                         html.Div(
                             "Check these first before treating the issue as larger than it is.",
@@ -466,21 +469,13 @@ class HelpPage:
                                     "For batch apply issues, check cross-file detector consistency first."
                                 ),
                             ],
-                            style={
-                                "display": "flex",
-                                "flexDirection": "column",
-                                "gap": "10px",
-                            },
+                            style=_STACK_STYLE,
                         ),
                     ],
-                    style={
-                        "padding": "16px",
-                    },
+                    style=_CARD_BODY_STYLE,
                 ),
             ],
-            style={
-                "height": "100%",
-            },
+            style=_FULL_HEIGHT_CARD_STYLE,
         )
 
         return ui_forms.apply_workflow_section_card_style(
@@ -500,10 +495,7 @@ class HelpPage:
                     [
                         html.Div(
                             "Troubleshooting",
-                            style={
-                                "fontWeight": "750",
-                                "fontSize": "1.02rem",
-                            },
+                            style=_CARD_TITLE_STYLE,
                         ),
                         html.Div(
                             "Common symptoms and where to look first.",
@@ -514,7 +506,7 @@ class HelpPage:
                 dbc.CardBody(
                     [
                         dbc.Row(
-                            [
+                            (
                                 dbc.Col(
                                     self._troubleshooting_panel(
                                         title="Upload and detector issues",
@@ -575,13 +567,11 @@ class HelpPage:
                                     ),
                                     lg=4,
                                 ),
-                            ],
+                            ),
                             className="g-3",
                         ),
                     ],
-                    style={
-                        "padding": "16px",
-                    },
+                    style=_CARD_BODY_STYLE,
                 ),
             ]
         )
@@ -645,10 +635,7 @@ class HelpPage:
                     [
                         html.Div(
                             "What to collect when something looks wrong",
-                            style={
-                                "fontWeight": "750",
-                                "fontSize": "1.02rem",
-                            },
+                            style=_CARD_TITLE_STYLE,
                         ),
                         html.Div(
                             "The smallest useful debugging package.",
@@ -704,9 +691,7 @@ class HelpPage:
                             },
                         ),
                     ],
-                    style={
-                        "padding": "16px",
-                    },
+                    style=_CARD_BODY_STYLE,
                 ),
             ]
         )
@@ -827,18 +812,11 @@ class HelpPage:
             [
                 html.Div(
                     title,
-                    style={
-                        "fontWeight": "700",
-                        "fontSize": "0.92rem",
-                        "marginBottom": "3px",
-                    },
+                    style=_ITEM_TITLE_STYLE,
                 ),
                 html.Div(
                     description,
-                    style={
-                        "fontSize": "0.88rem",
-                        "opacity": 0.74,
-                    },
+                    style=_ITEM_DESCRIPTION_STYLE,
                 ),
             ],
             style={
@@ -859,18 +837,11 @@ class HelpPage:
             [
                 html.Div(
                     title,
-                    style={
-                        "fontWeight": "700",
-                        "fontSize": "0.92rem",
-                        "marginBottom": "3px",
-                    },
+                    style=_ITEM_TITLE_STYLE,
                 ),
                 html.Div(
                     description,
-                    style={
-                        "fontSize": "0.88rem",
-                        "opacity": 0.74,
-                    },
+                    style=_ITEM_DESCRIPTION_STYLE,
                 ),
             ],
             style={
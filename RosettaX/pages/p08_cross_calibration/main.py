@@ -15,6 +15,16 @@ from RosettaX.workflow.cross_calibration import services
 from .ids import Ids
 
 
+# Mirrors services.export_button_should_be_disabled.
+_EXPORT_BUTTON_DISABLED_CLIENTSIDE_FUNCTION = """
+function(result, exportName) {
+    const hasResult = result !== null && typeof result === "object" && !Array.isArray(result);
+
+    return !hasResult || String(exportName || "").trim() === "";
+}
+"""
+
+
 class CrossCalibrationPage:
     """
     Cross-calibration workflow page.
@@ -531,17 +541,15 @@ class CrossCalibrationPage:
                 runtime_config_data=runtime_config_data,
             )
 
-        @dash.callback(
+        # Runs in the browser so typing an export name does not send one
+        # server request per keystroke.
+        dash.clientside_callback(
+            _EXPORT_BUTTON_DISABLED_CLIENTSIDE_FUNCTION,
             dash.Output(self.ids.export_button, "disabled"),
             dash.Input(self.ids.result_store, "data"),
             dash.Input(self.ids.export_name, "value"),
             prevent_initial_call=False,
         )
-        def toggle_export_button(
-            result: Any,
-            export_name: Any,
-        ) -> bool:
-            return not isinstance(result, dict) or not bool(str(export_name or "").strip())
 
         @dash.callback(
             dash.Output(self.ids.export_download, "data"),
@@ -2,6 +2,7 @@
 
 import logging
 from dataclasses import asdict, dataclass, field
+from pathlib import Path
 from typing import Any, Optional
 
 from RosettaX.utils import directories
@@ -83,7 +84,7 @@ def _sort_profile_names(
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BrowserProfileLibrary:
     """
     Browser-owned profile collection persisted in local Dash storage.
@@ -129,6 +130,36 @@ class BrowserProfileLibrary:
             ),
         )
 
+    @classmethod
+    def seed_data_signature(cls) -> tuple[Any, ...]:
+        """
+        Return a cheap fingerprint of the files read by ``from_seed_data``.
+
+        The fingerprint changes whenever a packaged profile or a default profile
+        candidate is created, removed or rewritten.
+        """
+        profile_directory = Path(directories.profiles)
+
+        try:
+            profile_file_names = sorted(directories.list_json_file_names(profile_directory))
+        except OSError:
+            profile_file_names = []
+
+        packaged_profile_signature = []
+
+        for profile_file_name in profile_file_names:
+            try:
+                modification_time_ns = (profile_directory / profile_file_name).stat().st_mtime_ns
+            except OSError:
+                modification_time_ns = None
+
+            packaged_profile_signature.append((profile_file_name, modification_time_ns))
+
+        return (
+            tuple(packaged_profile_signature),
+            RuntimeConfig.default_profile_signature(),
+        )
+
     @classmethod
     def from_dict(cls, payload: Any) -> "BrowserProfileLibrary":
         """
@@ -200,11 +200,12 @@ class FCSMultiFileConsistencyChecker:
 
         self._metadata_by_file_path[normalized_file_path] = file_metadata
 
-        logger.debug(
-            "Read FCS metadata for file_path=%r, summary=%r",
-            normalized_file_path,
-            file_metadata.debug_summary(),
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Read FCS metadata for file_path=%r, summary=%r",
+                normalized_file_path,
+                file_metadata.debug_summary(),
+            )
 
         return file_metadata
 
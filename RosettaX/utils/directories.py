@@ -39,6 +39,34 @@ fluorescence_calibration = calibrations / "fluorescence"
 scattering_calibration = calibrations / "scattering"
 
 
+def list_json_file_names(directory: Path) -> list[str]:
+    """
+    Gets the names of the json files stored directly in a directory.
+
+    The directory is read in a single ``os.scandir`` pass. Each entry reuses the file type reported by the directory listing, so the files are not stat-ed one by one.
+
+    Parameters
+    ----------
+    directory : Path
+        Directory to scan.
+
+    Returns
+    -------
+    list[str]
+        Json filenames, including the .json extension, in directory order. A
+        missing directory yields an empty list, as a glob would.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return [
+                entry.name
+                for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            ]
+    except FileNotFoundError:
+        return []
+
+
 def list_profiles() -> list[str]:
     """
     Gets list of saved profiles from the settings directory. Each profile is a json file that contains a set of default values for the fluorescence calibration page. This function returns a list of filenames.
@@ -48,11 +76,10 @@ def list_profiles() -> list[str]:
     list[str]
         List of profile filenames without the .json extension.
     """
-    list_of_filenames = []
-    for file in profiles.iterdir():
-        if file.is_file() and file.suffix == ".json":
-            list_of_filenames.append(file.name.replace(".json", ""))
-    return list_of_filenames
+    return [
+        filename.removesuffix(".json")
+        for filename in list_json_file_names(profiles)
+    ]
 
 def list_calibrations(calibration_type: str) -> list[str]:
     """
@@ -75,11 +102,7 @@ def list_calibrations(calibration_type: str) -> list[str]:
     else:
         raise ValueError(f"Invalid calibration type: {calibration_type}")
 
-    list_of_filenames = []
-    for file in directory.iterdir():
-        if file.is_file() and file.suffix == ".json":
-            list_of_filenames.append(file.name)
-    return list_of_filenames
+    return list_json_file_names(directory)
 
 
 def open_directory(path: Path) -> None:
@@ -67,13 +67,14 @@ def load_signal(
     if max_events_for_analysis is not None:
         signal = signal[: int(max_events_for_analysis)]
 
-    logger.debug(
-        "load_signal returning detector_column=%r n_values=%r min=%r max=%r",
-        resolved_detector_column,
-        signal.size,
-        None if signal.size == 0 else float(np.min(signal)),
-        None if signal.size == 0 else float(np.max(signal)),
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "load_signal returning detector_column=%r n_values=%r min=%r max=%r",
+            resolved_detector_column,
+            signal.size,
+            None if signal.size == 0 else float(np.min(signal)),
+            None if signal.size == 0 else float(np.max(signal)),
+        )
 
     return signal
 
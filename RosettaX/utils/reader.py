@@ -77,10 +77,11 @@ class FCSFile:
             delimiter=self.delimiter,
         )
 
-        logger.debug(
-            "Parsed FCS metadata: %r",
-            self.metadata.debug_summary(),
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Parsed FCS metadata: %r",
+                self.metadata.debug_summary(),
+            )
 
         self._open_mmap()
 
@@ -391,30 +392,25 @@ class FCSFile:
 
     @staticmethod
     def _split_text_payload(payload: str, delimiter: str) -> List[str]:
-        tokens: List[str] = []
-        token_chars: List[str] = []
-
-        index = 0
-
-        while index < len(payload):
-            ch = payload[index]
+        """
+        Split a TEXT payload on the delimiter, honouring doubled delimiters.
 
-            if ch == delimiter:
-                if index + 1 < len(payload) and payload[index + 1] == delimiter:
-                    token_chars.append(delimiter)
-                    index += 2
-                    continue
+        A doubled delimiter is an escaped literal delimiter. Splitting on the
+        doubled form first and then on the single delimiter keeps the same
+        left to right pairing as a character scan while staying in C.
+        """
+        escaped_delimiter = delimiter + delimiter
 
-                tokens.append("".join(token_chars))
-                token_chars = []
-                index += 1
-                continue
+        escaped_chunks = payload.split(escaped_delimiter)
+        tokens = escaped_chunks[0].split(delimiter)
 
-            token_chars.append(ch)
-            index += 1
+        for escaped_chunk in escaped_chunks[1:]:
+            chunk_tokens = escaped_chunk.split(delimiter)
+            tokens[-1] += delimiter + chunk_tokens[0]
+            tokens.extend(chunk_tokens[1:])
 
-        if token_chars:
-            tokens.append("".join(token_chars))
+        if tokens and tokens[-1] == "":
+            tokens.pop()
 
         return tokens
 
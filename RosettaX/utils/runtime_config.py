@@ -2,6 +2,7 @@
 import copy
 import json
 import logging
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, ClassVar, Optional
@@ -14,6 +15,8 @@ logger = logging.getLogger(__name__)
 
 
 _MISSING = object()
+_JSON_PATH_CACHE_LOCK = threading.Lock()
+_json_path_payload_cache: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
 
 
 @dataclass(frozen=True, slots=True)
@@ -526,6 +529,19 @@ class RuntimeConfig:
             "RuntimeConfig.from_json_path called with path=%r", str(resolved_json_path)
         )
 
+        file_stat = resolved_json_path.stat()
+        file_signature = (file_stat.st_mtime_ns, file_stat.st_size)
+
+        with _JSON_PATH_CACHE_LOCK:
+            cached_entry = _json_path_payload_cache.get(resolved_json_path)
+
+        if cached_entry is not None and cached_entry[0] == file_signature:
+            logger.debug(
+                "Reusing normalized RuntimeConfig payload for unchanged path=%r",
+                str(resolved_json_path),
+            )
+            return cls.from_trusted_payload(cached_entry[1])
+
         with resolved_json_path.open("r", encoding="utf-8") as file_handle:
             payload = json.load(file_handle)
 
@@ -539,7 +555,29 @@ class RuntimeConfig:
             str(resolved_json_path),
             list(payload.keys()),
         )
-        return cls.from_dict(payload)
+        runtime_config = cls.from_dict(payload)
+
+        with _JSON_PATH_CACHE_LOCK:
+            _json_path_payload_cache[resolved_json_path] = (
+                file_signature,
+                copy.deepcopy(runtime_config.data),
+            )
+
+        return runtime_config
+
+    @classmethod
+    def from_trusted_payload(cls, payload: dict[str, Any]) -> "RuntimeConfig":
+        """
+        Build a RuntimeConfig from a payload that was already normalized.
+
+        Normalization is skipped and the payload is only deep-copied, so the
+        returned instance reports ``validate_known_paths_on_init=False``. Only
+        pass payloads produced by ``to_dict`` or by an earlier normalized load.
+        """
+        return cls(
+            data=payload,
+            validate_known_paths_on_init=False,
+        )
 
     @classmethod
     def from_profile_name(cls, json_filename: str) -> "RuntimeConfig":
@@ -567,12 +605,7 @@ class RuntimeConfig:
         The first valid JSON object found among the candidate paths becomes the
         initial runtime payload.
         """
-        candidate_paths = [
-            Path(directories.default_profile),
-            Path(directories.profiles) / "default_profile.json",
-        ]
-
-        for json_path in candidate_paths:
+        for json_path in cls._default_profile_candidate_paths():
             if not json_path.exists():
                 logger.debug(
                     "Default profile candidate does not exist: %r", str(json_path)
@@ -594,6 +627,34 @@ class RuntimeConfig:
         )
         return cls()
 
+    @classmethod
+    def default_profile_signature(cls) -> tuple[tuple[str, Optional[int]], ...]:
+        """
+        Return a cheap fingerprint of the startup default profile candidates.
+
+        The fingerprint changes whenever a candidate file is created, removed or
+        rewritten, so anything derived from ``from_default_profile`` can be
+        reused until it does.
+        """
+        signature = []
+
+        for json_path in cls._default_profile_candidate_paths():
+            try:
+                modification_time_ns = json_path.stat().st_mtime_ns
+            except OSError:
+                modification_time_ns = None
+
+            signature.append((str(json_path), modification_time_ns))
+
+        return tuple(signature)
+
+    @staticmethod
+    def _default_profile_candidate_paths() -> list[Path]:
+        return [
+            Path(directories.default_profile),
+            Path(directories.profiles) / "default_profile.json",
+        ]
+
     @staticmethod
     def _split_path(path: str) -> list[str]:
         normalized_path = str(path).strip()
@@ -1303,7 +1364,9 @@ class RuntimeConfig:
         """
         Write the configuration to a JSON file.
 
-        Parent directories are created automatically if they do not exist.
+        Parent directories are created automatically if they do not exist. The
+        file is written to a temporary sibling and moved into place, so readers
+        never see a partially written profile.
 
         Parameters
         ----------
@@ -1317,8 +1380,20 @@ class RuntimeConfig:
 
         self.validate()
 
-        with resolved_json_path.open("w", encoding="utf-8") as file_handle:
-            json.dump(self.to_dict(), file_handle, indent=indent, ensure_ascii=False)
+        temporary_json_path = resolved_json_path.with_suffix(
+            f"{resolved_json_path.suffix}.tmp",
+        )
+
+        try:
+            with temporary_json_path.open("w", encoding="utf-8") as file_handle:
+                json.dump(self.to_dict(), file_handle, indent=indent, ensure_ascii=False)
+
+            with _JSON_PATH_CACHE_LOCK:
+                temporary_json_path.replace(resolved_json_path)
+                _json_path_payload_cache.pop(resolved_json_path, None)
+        except BaseException:
+            temporary_json_path.unlink(missing_ok=True)
+            raise
 
         logger.debug(
             "RuntimeConfig.to_json_path wrote config to path=%r",
@@ -7,6 +7,7 @@ import json
 import logging
 import re
 
+from RosettaX.utils import directories
 from RosettaX.utils.reader import FCSFile
 
 
@@ -374,9 +375,7 @@ def list_saved_calibrations_from_directory(
         Mapping folder name to list of filenames.
     """
     files = sorted(
-        file_path.name
-        for file_path in Path(directory).glob("*.json")
-        if file_path.is_file()
+        directories.list_json_file_names(Path(directory))
     )
 
     if not files:
@@ -9,6 +9,38 @@ from RosettaX.utils import styling
 from RosettaX.utils.upload_limits import format_upload_size, get_max_upload_bytes
 
 
+_UPLOAD_WIDGET_STYLE = styling.merge_style(
+    styling.UPLOAD,
+    {
+        "lineHeight": "1.35",
+        "padding": "14px 16px",
+        "display": "flex",
+        "flexDirection": "column",
+        "alignItems": "center",
+        "justifyContent": "center",
+    },
+)
+
+_UPLOAD_PROMPT_STYLE = {
+    "fontWeight": "650",
+    "textDecoration": "none",
+}
+
+_UPLOAD_DETAILS_STYLE = {
+    "fontSize": "0.82rem",
+    "marginTop": "4px",
+    "opacity": 0.72,
+}
+
+# Vertical gap between stacked page sections. It carries no id, so the same
+# component can appear several times in one layout.
+SECTION_SPACER = html.Div(
+    style={
+        "height": "18px",
+    },
+)
+
+
 def _token_px_to_int(token_value: str, fallback: int) -> int:
     """
     Convert a px token value into an integer fallback-safe value.
@@ -146,35 +178,18 @@ def build_upload_widget(
             [
                 html.Div(
                     prompt_text,
-                    style={
-                        "fontWeight": "650",
-                        "textDecoration": "none",
-                    },
+                    style=_UPLOAD_PROMPT_STYLE,
                 ),
                 html.Div(
                     (
                         f"{selection_text} · Accepted: {accepted_file_extensions} · "
                         f"Maximum file size: {format_upload_size(resolved_max_size)}"
                     ),
-                    style={
-                        "fontSize": "0.82rem",
-                        "marginTop": "4px",
-                        "opacity": 0.72,
-                    },
+                    style=_UPLOAD_DETAILS_STYLE,
                 ),
             ]
         ),
-        style=styling.merge_style(
-            styling.UPLOAD,
-            {
-                "lineHeight": "1.35",
-                "padding": "14px 16px",
-                "display": "flex",
-                "flexDirection": "column",
-                "alignItems": "center",
-                "justifyContent": "center",
-            },
-        ),
+        style=_UPLOAD_WIDGET_STYLE,
         max_size=resolved_max_size,
         multiple=multiple,
         accept=accepted_file_extensions,
@@ -1146,6 +1146,9 @@ def _log_array_summary(
     """
     Log a compact numerical summary of an array.
     """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+
     try:
         array = np.asarray(
             values,
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 
-from typing import Any
+from typing import Any, Iterable, Optional, Protocol
 
 import dash
 import dash_bootstrap_components as dbc
@@ -14,6 +14,33 @@ COLLAPSE_ID_TYPE = "calibration-card-collapse"
 TOGGLE_LABEL_ID_TYPE = "calibration-card-toggle-label"
 
 
+# Browser-side twin of ``resolve_card_toggle``. ``runtime-config-store``
+# always holds a normalized ``RuntimeConfig.to_dict()`` payload, so the
+# profile preference is already a plain boolean under ``ui``.
+CARD_TOGGLE_CLIENTSIDE_FUNCTION = """
+function(nClicks, runtimeConfigData, isOpen) {
+    const triggered = window.dash_clientside.callback_context.triggered || [];
+    const toggleClicked = triggered.some(
+        (trigger) => String(trigger.prop_id || "").endsWith(".n_clicks")
+    );
+
+    let nextIsOpen;
+    if (toggleClicked) {
+        nextIsOpen = !isOpen;
+    } else {
+        const ui = runtimeConfigData && runtimeConfigData.ui;
+        nextIsOpen = !(ui && ui.collapse_calibration_cards === true);
+    }
+
+    return [nextIsOpen, nextIsOpen ? "Hide" : "Show"];
+}
+"""
+
+
+class _Section(Protocol):
+    def register_callbacks(self) -> None: ...
+
+
 def _component_id(*, id_type: str, page_name: str, section_key: str) -> dict[str, str]:
     return {
         "type": id_type,
@@ -103,20 +130,54 @@ def make_collapsible_section_card(
     return card
 
 
-def build_collapsible_section_layout(section: Any, *, page_name: str) -> Any:
+def build_collapsible_section_layout(
+    section: Any,
+    *,
+    page_name: str,
+    initially_collapsed: Optional[bool] = None,
+) -> Any:
     """Build a section and collapse numbered workflow cards."""
     layout = section.get_layout()
     section_number = getattr(section, "section_number", None)
     if section_number is None or not isinstance(layout, dbc.Card):
         return layout
 
-    return make_profile_aware_collapsible_card(
+    if initially_collapsed is None:
+        return make_profile_aware_collapsible_card(
+            layout,
+            page_name=page_name,
+            section_key=str(section_number),
+        )
+
+    return make_collapsible_section_card(
         layout,
         page_name=page_name,
         section_key=str(section_number),
+        initially_collapsed=initially_collapsed,
     )
 
 
+def build_collapsible_section_layouts(sections: Iterable[Any], *, page_name: str) -> list[Any]:
+    """Build every section of a page, reading the default profile only once."""
+    initially_collapsed = profile_collapses_calibration_cards(
+        RuntimeConfig.from_default_profile().to_dict()
+    )
+    return [
+        build_collapsible_section_layout(
+            section,
+            page_name=page_name,
+            initially_collapsed=initially_collapsed,
+        )
+        for section in sections
+    ]
+
+
+def register_section_callbacks(sections: Iterable[_Section]) -> None:
+    """Register callbacks for every section of a workflow page."""
+    for section in sections:
+        section.register_callbacks()
+
+
 def make_profile_aware_collapsible_card(
     card: dbc.Card,
     *,
@@ -140,7 +201,10 @@ def resolve_card_toggle(
     is_open: Any,
     runtime_config_data: Any,
 ) -> tuple[bool, str]:
-    """Resolve a click toggle or reset the card from a newly loaded profile."""
+    """Resolve a click toggle or reset the card from a newly loaded profile.
+
+    The app runs ``CARD_TOGGLE_CLIENTSIDE_FUNCTION``; keep both in step.
+    """
     if isinstance(triggered_id, dict) and triggered_id.get("type") == TOGGLE_ID_TYPE:
         next_is_open = not bool(is_open)
     else:
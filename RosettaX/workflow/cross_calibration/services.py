@@ -711,6 +711,19 @@ def build_result_status_text(
     return summary
 
 
+def export_button_should_be_disabled(
+    result: Any,
+    export_name: Any,
+) -> bool:
+    """
+    Return whether the cross-calibration export button should stay disabled.
+
+    The browser runs the same rule through the cross calibration page's
+    clientside export button callback; keep both in step.
+    """
+    return not isinstance(result, dict) or not bool(str(export_name or "").strip())
+
+
 def build_export_payload(
     *,
     result: dict[str, Any],
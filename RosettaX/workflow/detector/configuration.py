@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
+import copy
 import json
 import logging
 import re
@@ -650,28 +652,59 @@ def resolve_rule_based_detector_preset(
     return None
 
 
-def load_detector_auto_detect_rules() -> list[dict[str, Any]]:
+def load_detector_auto_detect_rules(
+    rules_path: Optional[Path | str] = None,
+) -> list[dict[str, Any]]:
     """
     Load detector auto-detect rules from the shared JSON file.
+
+    Parsed rules are cached per file modification time, so auto-detection
+    inside upload callbacks does not re-read the file each time. Callers get
+    deep copies, so editing a returned rule never reaches the cache.
     """
-    if not DETECTOR_AUTO_DETECT_RULES_PATH.exists():
+    resolved_rules_path = Path(
+        DETECTOR_AUTO_DETECT_RULES_PATH if rules_path is None else rules_path
+    )
+
+    try:
+        file_stat = resolved_rules_path.stat()
+    except OSError:
         return []
 
+    return copy.deepcopy(
+        list(
+            _load_detector_auto_detect_rules_cached(
+                rules_path=str(resolved_rules_path),
+                modified_time_ns=int(file_stat.st_mtime_ns),
+                file_size=int(file_stat.st_size),
+            )
+        )
+    )
+
+
+@lru_cache(maxsize=4)
+def _load_detector_auto_detect_rules_cached(
+    *,
+    rules_path: str,
+    modified_time_ns: int,
+    file_size: int,
+) -> tuple[dict[str, Any], ...]:
+    """Read and normalize the auto-detect rules of one file version."""
     try:
         raw_payload = json.loads(
-            DETECTOR_AUTO_DETECT_RULES_PATH.read_text(encoding="utf-8")
+            Path(rules_path).read_text(encoding="utf-8")
         )
     except Exception:
         logger.exception(
             "Failed to load detector auto-detect rules from %s",
-            DETECTOR_AUTO_DETECT_RULES_PATH,
+            rules_path,
         )
-        return []
+        return ()
 
     raw_rules = raw_payload.get("rules") if isinstance(raw_payload, dict) else None
 
     if not isinstance(raw_rules, list):
-        return []
+        return ()
 
     normalized_rules: list[dict[str, Any]] = []
 
@@ -695,11 +728,19 @@ def load_detector_auto_detect_rules() -> list[dict[str, Any]]:
                     if clean_optional_string(instrument_alias)
                 ],
                 "detector_preset": clean_optional_string(raw_rule.get("detector_preset")),
-                "detector_channels": detector_channels if isinstance(detector_channels, dict) else {},
+                "detector_channels": {
+                    clean_optional_string(role_name): [
+                        clean_optional_string(candidate_name)
+                        for candidate_name in candidate_names
+                        if clean_optional_string(candidate_name)
+                    ]
+                    for role_name, candidate_names in detector_channels.items()
+                    if clean_optional_string(role_name) and isinstance(candidate_names, list)
+                } if isinstance(detector_channels, dict) else {},
             }
         )
 
-    return normalized_rules
+    return tuple(normalized_rules)
 
 
 def extract_instrument_name_from_metadata(
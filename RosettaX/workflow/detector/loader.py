@@ -4,7 +4,7 @@ import copy
 import json
 import logging
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 DEFAULT_DETECTOR_PRESET_PATH = (
@@ -98,6 +98,33 @@ class DetectorPresetLoader:
 
         return detector_presets
 
+    def preset_signature(self) -> tuple[tuple[str, Optional[int]], ...]:
+        """
+        Return a cheap fingerprint of the files read by ``load_presets``.
+
+        The fingerprint changes whenever a preset file is created, removed or
+        rewritten, so anything derived from the presets can be reused until it
+        does.
+        """
+        detector_preset_path = self.preset_path.resolve()
+
+        if detector_preset_path.is_dir():
+            candidate_paths = sorted(detector_preset_path.glob("**/*.json"))
+        else:
+            candidate_paths = [detector_preset_path]
+
+        signature = []
+
+        for candidate_path in candidate_paths:
+            try:
+                modification_time_ns = candidate_path.stat().st_mtime_ns
+            except OSError:
+                modification_time_ns = None
+
+            signature.append((str(candidate_path), modification_time_ns))
+
+        return tuple(signature)
+
     def _load_presets_from_directory(
         self,
         detector_directory: Path,
@@ -109,6 +109,13 @@ core_shell_table_columns = [
     },
 ]
 
+_SPHERE_EMPTY_ROW = {
+    column["id"]: "" for column in sphere_table_columns
+}
+_CORE_SHELL_EMPTY_ROW = {
+    column["id"]: "" for column in core_shell_table_columns
+}
+
 
 def resolve_mie_model(
     mie_model: Any,
@@ -153,11 +160,17 @@ def get_user_data_column_ids_for_model(
 ) -> list[str]:
     """
     Return the columns that should count as populated table data.
+
+    The shared column definitions are only read here, so they are passed
+    without the defensive copies ``get_table_columns_for_model`` makes.
     """
+    if resolve_mie_model(mie_model) == MIE_MODEL_CORE_SHELL_SPHERE:
+        columns = core_shell_table_columns
+    else:
+        columns = sphere_table_columns
+
     return table_services.get_column_ids(
-        columns=get_table_columns_for_model(
-            mie_model,
-        )
+        columns=columns,
     )
 
 
@@ -172,26 +185,9 @@ def build_empty_row_for_model(
     )
 
     if resolved_mie_model == MIE_MODEL_CORE_SHELL_SPHERE:
-        return {
-            COLUMN_CORE_DIAMETER_NM: "",
-            COLUMN_SHELL_THICKNESS_NM: "",
-            COLUMN_OUTER_DIAMETER_NM: "",
-            COLUMN_MEDIUM_REFRACTIVE_INDEX: "",
-            COLUMN_CORE_REFRACTIVE_INDEX: "",
-            COLUMN_SHELL_REFRACTIVE_INDEX: "",
-            COLUMN_MEASURED_PEAK_POSITION: "",
-            COLUMN_EXPECTED_COUPLING: "",
-            COLUMN_EXPECTED_CROSS_SECTION_NM2: "",
-        }
+        return dict(_CORE_SHELL_EMPTY_ROW)
 
-    return {
-        COLUMN_PARTICLE_DIAMETER_NM: "",
-        COLUMN_PARTICLE_REFRACTIVE_INDEX: "",
-        COLUMN_MEDIUM_REFRACTIVE_INDEX: "",
-        COLUMN_MEASURED_PEAK_POSITION: "",
-        COLUMN_EXPECTED_COUPLING: "",
-        COLUMN_EXPECTED_CROSS_SECTION_NM2: "",
-    }
+    return dict(_SPHERE_EMPTY_ROW)
 
 
 def build_empty_rows_for_model(
@@ -543,10 +543,15 @@ class FluorescencePeakWorkflowAdapter(BasePeakWorkflowAdapter):
             descending=descending,
         )
 
+        # Rows before the last filled index are never empty again, so each
+        # search resumes there instead of rescanning the table from the top.
+        empty_row_index = 0
+
         for normalized_x_value in normalized_x_values:
             empty_row_index = self.find_first_empty_value_row_index(
                 rows=rows,
                 column_name=target_column_name,
+                start_index=empty_row_index,
             )
 
             if empty_row_index is None:
@@ -674,14 +679,13 @@ class FluorescencePeakWorkflowAdapter(BasePeakWorkflowAdapter):
         *,
         rows: list[dict[str, Any]],
         column_name: str,
+        start_index: int = 0,
     ) -> Optional[int]:
         """
-        Return the first row where the target column is empty.
+        Return the first row at or after ``start_index`` where the target column is empty.
         """
-        for row_index, row in enumerate(
-            rows,
-        ):
-            value = row.get(
+        for row_index in range(start_index, len(rows)):
+            value = rows[row_index].get(
                 column_name,
                 "",
             )
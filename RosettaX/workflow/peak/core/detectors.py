@@ -1,17 +1,25 @@
 # -*- coding: utf-8 -*-
 
+from collections import OrderedDict
 from typing import Any, Optional
+from dataclasses import replace
+from functools import lru_cache
 from pathlib import Path
-import json
+import hashlib
 import logging
+import threading
 
 from .. import registry
 from RosettaX.utils.fcs_metadata import FCSMetadata
 from RosettaX.utils.reader import FCSFile
 from RosettaX.utils.runtime_config import RuntimeConfig
+from RosettaX.workflow.detector import configuration as detector_configuration
 
 
 logger = logging.getLogger(__name__)
+DETECTOR_HEADER_CACHE_MAX_ENTRIES = 32
+_DETECTOR_HEADER_CACHE_LOCK = threading.Lock()
+_detector_headers_by_fingerprint: "OrderedDict[tuple[str, int], tuple[tuple[str, ...], FCSMetadata]]" = OrderedDict()
 DETECTOR_AUTO_DETECT_RULES_PATH = Path(__file__).parents[2] / "detector" / (
     "detector_auto_detect_rules.json"
 )
@@ -122,9 +130,9 @@ def populate_peak_script_detector_dropdowns(
         )
 
     try:
-        with FCSFile(uploaded_fcs_path_clean) as fcs_file:
-            column_names = fcs_file.get_column_names()
-            metadata = fcs_file.get_metadata()
+        column_names, metadata = read_detector_header(
+            uploaded_fcs_path_clean,
+        )
 
     except Exception:
         logger.exception(
@@ -209,6 +217,114 @@ def populate_peak_script_detector_dropdowns(
     return resolved_options, resolved_values
 
 
+def read_detector_header(
+    uploaded_fcs_path: str,
+) -> tuple[list[str], FCSMetadata]:
+    """
+    Return the detector column names and metadata of an FCS file.
+
+    The parsed header is cached per file path, modification time, and size.
+    The peak detector dropdowns and the apply page channel picker share this
+    cache, so an unchanged upload is parsed once however many callbacks ask
+    for its detectors. Behind it, headers are also cached by a fingerprint of
+    the FCS HEADER and TEXT segments, so the same bead file uploaded again,
+    by another session or under another staged path, is not parsed twice.
+
+    Parameters
+    ----------
+    uploaded_fcs_path:
+        Uploaded FCS file path.
+
+    Returns
+    -------
+    tuple[list[str], FCSMetadata]
+        Detector column names in file order and the parsed metadata.
+    """
+    file_path = Path(uploaded_fcs_path).expanduser().resolve()
+    file_stat = file_path.stat()
+
+    column_names, metadata = _read_detector_header_cached(
+        file_path=str(file_path),
+        modified_time_ns=int(file_stat.st_mtime_ns),
+        file_size=int(file_stat.st_size),
+    )
+
+    return list(column_names), metadata
+
+
+@lru_cache(maxsize=32)
+def _read_detector_header_cached(
+    *,
+    file_path: str,
+    modified_time_ns: int,
+    file_size: int,
+) -> tuple[tuple[str, ...], FCSMetadata]:
+    """Read and cache the column names and metadata of one FCS file."""
+    fingerprint = _fingerprint_fcs_text_segment(file_path)
+
+    if fingerprint is None:
+        with FCSFile(file_path) as fcs_file:
+            return tuple(fcs_file.get_column_names()), fcs_file.get_metadata()
+
+    cache_key = (fingerprint, file_size)
+
+    with _DETECTOR_HEADER_CACHE_LOCK:
+        cached_header = _detector_headers_by_fingerprint.get(cache_key)
+
+    if cached_header is not None:
+        column_names, metadata = cached_header
+
+        if isinstance(metadata, FCSMetadata) and metadata.file_path != file_path:
+            metadata = replace(metadata, file_path=file_path)
+
+        return column_names, metadata
+
+    with FCSFile(file_path) as fcs_file:
+        detector_header = tuple(fcs_file.get_column_names()), fcs_file.get_metadata()
+
+    with _DETECTOR_HEADER_CACHE_LOCK:
+        _detector_headers_by_fingerprint[cache_key] = detector_header
+
+        while len(_detector_headers_by_fingerprint) > DETECTOR_HEADER_CACHE_MAX_ENTRIES:
+            _detector_headers_by_fingerprint.popitem(last=False)
+
+    return detector_header
+
+
+def _fingerprint_fcs_text_segment(file_path: str) -> Optional[str]:
+    """
+    Hash the HEADER and TEXT segments of an FCS file.
+
+    Column names and metadata come entirely from these segments, so two files
+    with the same fingerprint and size parse to the same detector header.
+    Returns ``None`` when the HEADER does not give a TEXT end offset, in which
+    case the file is parsed directly rather than shared by fingerprint.
+    """
+    with open(file_path, "rb") as handle:
+        header_bytes = handle.read(58)
+
+        try:
+            text_end = int(header_bytes[18:26].strip() or b"0")
+        except ValueError:
+            return None
+
+        if text_end <= 0:
+            return None
+
+        handle.seek(0)
+        segment_bytes = handle.read(text_end + 1)
+
+    return hashlib.sha256(segment_bytes).hexdigest()
+
+
+def clear_detector_header_cache() -> None:
+    """Forget every cached detector header."""
+    _read_detector_header_cached.cache_clear()
+
+    with _DETECTOR_HEADER_CACHE_LOCK:
+        _detector_headers_by_fingerprint.clear()
+
+
 def infer_default_detector_channel(
     *,
     column_names: list[str],
@@ -496,63 +612,11 @@ def resolve_rule_based_detector_channel(
 
 def load_detector_auto_detect_rules() -> list[dict[str, Any]]:
     """
-    Load detector auto-detect rules from the shared JSON file.
+    Load detector auto-detect rules through the shared cached loader.
     """
-    if not DETECTOR_AUTO_DETECT_RULES_PATH.exists():
-        return []
-
-    try:
-        raw_payload = json.loads(
-            DETECTOR_AUTO_DETECT_RULES_PATH.read_text(encoding="utf-8")
-        )
-    except Exception:
-        logger.exception(
-            "Failed to load detector auto-detect rules from %s",
-            DETECTOR_AUTO_DETECT_RULES_PATH,
-        )
-        return []
-
-    if not isinstance(raw_payload, dict):
-        return []
-
-    raw_rules = raw_payload.get("rules")
-
-    if not isinstance(raw_rules, list):
-        return []
-
-    normalized_rules: list[dict[str, Any]] = []
-
-    for raw_rule in raw_rules:
-        if not isinstance(raw_rule, dict):
-            continue
-
-        instrument_aliases = raw_rule.get("instrument_aliases")
-        detector_channels = raw_rule.get("detector_channels")
-
-        if not isinstance(instrument_aliases, list) or not isinstance(detector_channels, dict):
-            continue
-
-        normalized_rules.append(
-            {
-                "name": clean_optional_string(raw_rule.get("name")) or "Unnamed detector rule",
-                "instrument_aliases": [
-                    clean_optional_string(instrument_alias)
-                    for instrument_alias in instrument_aliases
-                    if clean_optional_string(instrument_alias)
-                ],
-                "detector_channels": {
-                    clean_optional_string(role_name): [
-                        clean_optional_string(candidate_name)
-                        for candidate_name in candidate_names
-                        if clean_optional_string(candidate_name)
-                    ]
-                    for role_name, candidate_names in detector_channels.items()
-                    if clean_optional_string(role_name) and isinstance(candidate_names, list)
-                },
-            }
-        )
-
-    return normalized_rules
+    return detector_configuration.load_detector_auto_detect_rules(
+        DETECTOR_AUTO_DETECT_RULES_PATH,
+    )
 
 
 def extract_instrument_name_from_metadata(
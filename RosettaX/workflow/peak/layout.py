@@ -1110,6 +1110,7 @@ class PeakLayout:
                     type="text",
                     value=value,
                     placeholder=placeholder,
+                    debounce=True,
                     size="sm",
                     persistence=True,
                     persistence_type="session",
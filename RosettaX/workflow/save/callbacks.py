@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from typing import Any
+import json
 import logging
 
 import dash
@@ -10,6 +11,21 @@ from .adapters import SaveAdapter
 from .models import SaveConfig
 
 
+# Mirrors save_button_should_be_disabled. The trailing placeholder receives the
+# JSON encoded require_output_channel_name flag of the registering page.
+_SAVE_BUTTON_DISABLED_CLIENTSIDE_FUNCTION = """
+function(fileName, outputChannelName) {
+    const isBlank = (value) => String(value || "").trim() === "";
+
+    if (isBlank(fileName)) {
+        return true;
+    }
+
+    return %s && isBlank(outputChannelName);
+}
+"""
+
+
 def save_button_should_be_disabled(
     file_name: Any,
     output_channel_name: Any = None,
@@ -17,6 +33,9 @@ def save_button_should_be_disabled(
 ) -> bool:
     """
     Return whether the save button should be disabled.
+
+    The browser runs the same rule through
+    ``_SAVE_BUTTON_DISABLED_CLIENTSIDE_FUNCTION``; keep both in step.
     """
     if not bool(str(file_name or "").strip()):
         return True
@@ -68,23 +87,17 @@ def _register_save_button_enabled_state_callback(
 ) -> None:
     """
     Disable the save/download button until a calibration name is provided.
-    """
 
-    @dash.callback(
+    The check runs in the browser, so typing a name does not send one server
+    request per keystroke.
+    """
+    dash.clientside_callback(
+        _SAVE_BUTTON_DISABLED_CLIENTSIDE_FUNCTION % json.dumps(bool(config.require_output_channel_name)),
         dash.Output(ids.save_calibration_btn, "disabled"),
         dash.Input(ids.file_name, "value"),
         dash.Input(ids.output_channel_name, "value"),
         prevent_initial_call=False,
     )
-    def set_save_button_enabled_state(
-        file_name: Any,
-        output_channel_name: Any,
-    ) -> bool:
-        return save_button_should_be_disabled(
-            file_name=file_name,
-            output_channel_name=output_channel_name,
-            require_output_channel_name=config.require_output_channel_name,
-        )
 
 
 def _register_save_callback(
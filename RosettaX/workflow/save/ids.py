@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SaveIds:
     """
     Shared ID factory for reusable save sections.
@@ -14,10 +14,6 @@ class SaveIds:
 
     prefix: str
 
-    @property
-    def collapse(self) -> str:
-        return f"{self.prefix}-save-collapse"
-
     @property
     def save_calibration_btn(self) -> str:
         return f"{self.prefix}-save-calibration-btn"
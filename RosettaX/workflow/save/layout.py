@@ -38,7 +38,7 @@ class SaveLayout:
         return dbc.Card(
             [
                 self._build_header(),
-                self._build_collapse(),
+                self._build_body(),
             ]
         )
 
@@ -50,16 +50,6 @@ class SaveLayout:
             self.config.header_title,
         )
 
-    def _build_collapse(self) -> dbc.Collapse:
-        """
-        Build the save section collapse.
-        """
-        return dbc.Collapse(
-            self._build_body(),
-            id=self.ids.collapse,
-            is_open=True,
-        )
-
     def _build_body(self) -> dbc.CardBody:
         """
         Build the save section body.
@@ -71,7 +71,7 @@ def list_saved_calibrations() -> dict[str, list[str]]:
             directory_path.mkdir(parents=True, exist_ok=True)
 
             file_names = sorted(
-                [path.name for path in directory_path.glob("*.json") if path.is_file()],
+                directories.list_json_file_names(directory_path),
                 key=str.lower,
             )
 
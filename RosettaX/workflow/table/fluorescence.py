@@ -147,6 +147,11 @@ class FluorescenceReferenceTable:
         column_measured_intensity,
     ]
 
+    empty_row: dict[str, str] = {
+        column_calibrated_intensity: "",
+        column_measured_intensity: "",
+    }
+
     @classmethod
     def build_default_rows(
         cls,
@@ -427,10 +432,7 @@ class FluorescenceReferenceTable:
         """
         return table_services.append_empty_row(
             rows=rows,
-            empty_row={
-                cls.column_calibrated_intensity: "",
-                cls.column_measured_intensity: "",
-            },
+            empty_row=cls.empty_row,
         )
 
     @classmethod
@@ -61,3 +61,108 @@ class Test_FluorescenceCalibrationPreview:
             "Calibration fit created successfully. Preview computed for 123 valid events "
             "on detector 'FITC-A'."
         )
+
+    def test_calibration_figure_uses_webgl_traces(self) -> None:
+        figure = services.build_calibration_figure(
+            x_log10=np.asarray([1.0, 2.0, 3.0]),
+            y_log10=np.asarray([2.0, 3.0, 4.0]),
+            slope=1.0,
+            intercept=1.0,
+        )
+
+        assert [trace.type for trace in figure.data] == ["scattergl", "scattergl"]
+        assert [trace.name for trace in figure.data] == ["beads", "fit"]
+
+    def test_calibration_fit_line_is_drawn_from_its_end_points(self) -> None:
+        figure = services.build_calibration_figure(
+            x_log10=np.asarray([1.0, 2.5, 3.0]),
+            y_log10=np.asarray([2.0, 3.0, 4.0]),
+            slope=2.0,
+            intercept=0.5,
+        )
+
+        fit_trace = figure.data[1]
+
+        np.testing.assert_allclose(fit_trace.x, [1.0, 3.0])
+        np.testing.assert_allclose(fit_trace.y, [2.5, 6.5])
+
+    def test_calibration_figure_store_returns_independent_figure_dicts(self) -> None:
+        fit_arguments = {
+            "x_log10": np.asarray([1.0, 2.0, 3.0]),
+            "y_log10": np.asarray([2.0, 3.0, 4.0]),
+            "slope": 1.0,
+            "intercept": 1.0,
+        }
+
+        first_store = services.build_calibration_figure_store(**fit_arguments)
+        first_store["data"][0]["name"] = "mutated"
+        second_store = services.build_calibration_figure_store(**fit_arguments)
+
+        assert [trace["name"] for trace in second_store["data"]] == ["beads", "fit"]
+        assert second_store["layout"]["uirevision"] == "fluorescence_calibration_graph"
+
+    def test_rendered_calibration_graph_keeps_ui_revision(self) -> None:
+        figure_store = services.build_calibration_figure_store(
+            x_log10=np.asarray([1.0, 2.0, 3.0]),
+            y_log10=np.asarray([2.0, 3.0, 4.0]),
+            slope=1.0,
+            intercept=1.0,
+        )
+
+        figure = services.rebuild_calibration_graph(
+            stored_figure=figure_store,
+            empty_message="empty",
+            failure_message="failure",
+            logger=logging.getLogger(__name__),
+        )
+        rendered_figure = services.finalize_calibration_graph(figure=figure)
+
+        assert rendered_figure.layout.uirevision == "fluorescence_calibration_graph"
+
+    def test_extract_xy_from_table_skips_incomplete_and_invalid_rows(self) -> None:
+        extracted_points = services.extract_xy_from_table(
+            [
+                {"col1": "1000", "col2": "10"},
+                {"col1": "", "col2": "20"},
+                {"col1": "2000", "col2": "not a number"},
+                {"col1": 3000, "col2": "30,5"},
+            ]
+        )
+
+        np.testing.assert_allclose(extracted_points.intensity_calibrated_units, [1000.0, 3000.0])
+        np.testing.assert_allclose(extracted_points.intensity_au, [10.0, 30.5])
+
+    def test_extract_xy_from_table_returns_empty_arrays_without_rows(self) -> None:
+        extracted_points = services.extract_xy_from_table(None)
+
+        assert extracted_points.intensity_calibrated_units.shape == (0,)
+        assert extracted_points.intensity_au.shape == (0,)
+
+    def test_log_fit_drops_non_positive_and_non_finite_points(self) -> None:
+        fit_result = services.fit_log10_calibration(
+            intensity_calibrated_units=np.asarray([100.0, 1000.0, np.nan, 5.0, 10000.0]),
+            intensity_au=np.asarray([10.0, 100.0, 50.0, -1.0, np.inf]),
+        )
+
+        np.testing.assert_allclose(fit_result.intensity_au_log10, [1.0, 2.0])
+        assert fit_result.slope == pytest.approx(1.0)
+        assert fit_result.intercept == pytest.approx(1.0)
+
+    def test_log_fit_matches_polyfit_least_squares(self) -> None:
+        intensity_au = np.asarray([12.0, 95.0, 1100.0, 9800.0, 120000.0])
+        intensity_calibrated_units = np.asarray([150.0, 1300.0, 9000.0, 150000.0, 1.1e6])
+
+        fit_result = services.fit_log10_calibration(
+            intensity_calibrated_units=intensity_calibrated_units,
+            intensity_au=intensity_au,
+        )
+
+        expected_slope, expected_intercept = np.polyfit(
+            np.log10(intensity_au),
+            np.log10(intensity_calibrated_units),
+            1,
+        )
+
+        assert fit_result.slope == pytest.approx(expected_slope)
+        assert fit_result.intercept == pytest.approx(expected_intercept)
+        assert fit_result.prefactor == pytest.approx(10.0 ** expected_intercept)
@@ -92,6 +92,40 @@ class Test_HomePage:
         assert len(citation_buttons) == 1
         assert citation_buttons[0].href == "/citation"
 
+    def test_version_widget_is_reused_for_the_same_release_label(
+        self,
+        monkeypatch,
+    ) -> None:
+        monkeypatch.setattr(dash, "register_page", lambda *args, **kwargs: None)
+
+        home_main = importlib.import_module("RosettaX.pages.p01_home.main")
+
+        first_widget = home_main._build_version_widget("v1.0.0")
+
+        assert home_main._build_version_widget("v1.0.0") is first_widget
+        assert home_main._build_version_widget("v1.0.1") is not first_widget
+
+    def test_static_sections_are_built_without_a_page_instance(
+        self,
+        monkeypatch,
+    ) -> None:
+        monkeypatch.setattr(dash, "register_page", lambda *args, **kwargs: None)
+
+        home_main = importlib.import_module("RosettaX.pages.p01_home.main")
+        home_main = importlib.reload(home_main)
+
+        def fail_page_init(self) -> None:
+            raise AssertionError("HomePage should not be instantiated for the static sections.")
+
+        monkeypatch.setattr(home_main.HomePage, "__init__", fail_page_init)
+
+        sections = home_main._build_static_home_sections()
+
+        assert home_main._build_static_home_sections() is sections
+        assert "RosettaX" in _collect_text(sections[0])
+        assert "Citing this work" in _collect_text(sections[1])
+        assert "Open apply workflow" in _collect_text(sections[2])
+
 
 class Test_GitHubTagResolution:
     def test_resolve_latest_github_tag_label_uses_ttl_cache(
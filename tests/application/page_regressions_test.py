@@ -11,10 +11,12 @@ import pytest
 from RosettaX.application import layout as application_layout
 from RosettaX.pages.p00_sidebar.ids import SidebarIds
 from RosettaX.pages.p00_sidebar.main import Sidebar
+from RosettaX.workflow.sidebar import services as sidebar_services
 from RosettaX.pages.p02_fluorescence.ids import Ids as FluorescenceIds
 from RosettaX.pages.p02_fluorescence.sections.s04_calibration.main import Calibration
 from RosettaX.pages.p03_scattering.ids import Ids as ScatteringIds
 from RosettaX.pages.p03_scattering.sections.s03_model.main import Model as ScatteringModel
+from RosettaX.pages.p03_scattering.sections.s04_table.main import ReferenceTable as ScatteringReferenceTable
 from RosettaX.pages.p03_scattering.sections.s05_calibration.main import Calibration as ScatteringCalibration
 from RosettaX.pages.p03_scattering.sections.s05_calibration import services as scattering_services
 from RosettaX.pages.p04_calibrate.sections.s04_apply import services as apply_services
@@ -81,6 +83,19 @@ def _find_component_by_id(component, target_id: str):
     return _find_component_by_id(children, target_id)
 
 
+def _count_component_id(component, target_id: str) -> int:
+    count = 1 if getattr(component, "id", None) == target_id else 0
+    children = getattr(component, "children", None)
+
+    if children is None:
+        return count
+
+    if isinstance(children, (list, tuple)):
+        return count + sum(_count_component_id(child, target_id) for child in children)
+
+    return count + _count_component_id(children, target_id)
+
+
 def _collect_text(component) -> list[str]:
     if component is None:
         return []
@@ -113,6 +128,58 @@ class Test_FluorescenceCalibrationLayout:
 
         assert section.ids.graph_calibration in _collect_component_ids(layout)
 
+    def test_card_body_is_not_wrapped_in_a_static_collapse(self) -> None:
+        section = Calibration(
+            page=SimpleNamespace(ids=FluorescenceIds()),
+            section_number=4,
+        )
+
+        layout = section.get_layout()
+
+        assert type(layout.children[1]).__name__ == "CardBody"
+
+    def test_graph_ships_empty_calibration_placeholder(self) -> None:
+        section = Calibration(
+            page=SimpleNamespace(ids=FluorescenceIds()),
+            section_number=4,
+        )
+
+        graph = _find_component_by_id(section.get_layout(), section.ids.graph_calibration)
+
+        assert [annotation.text for annotation in graph.figure.layout.annotations] == [
+            "Create a calibration first.",
+        ]
+
+    def test_graph_callback_renders_placeholder_without_a_stored_calibration(self, monkeypatch) -> None:
+        registered_callbacks: dict[str, object] = {}
+
+        def capture_callback(*args, **kwargs):
+            def decorator(function):
+                registered_callbacks[function.__name__] = function
+                return function
+
+            return decorator
+
+        monkeypatch.setattr(dash, "callback", capture_callback)
+
+        section = Calibration(
+            page=SimpleNamespace(ids=FluorescenceIds()),
+            section_number=4,
+        )
+        section.register_callbacks()
+
+        update_calibration_graph = registered_callbacks["update_calibration_graph"]
+
+        figure = update_calibration_graph(
+            None,
+            {"visualization": {"default_font_size": 21.0}},
+        )
+
+        assert [annotation.text for annotation in figure.layout.annotations] == [
+            "Create a calibration first.",
+        ]
+        assert figure.layout.font.size == 21.0
+
 
 class Test_ScatteringCalibrationPreviewGraph:
     def test_preview_store_is_built_from_computed_solid_sphere_rows(
@@ -162,6 +229,70 @@ class Test_ScatteringCalibrationPreviewGraph:
         ]
 
 
+class Test_ScatteringPageLayout:
+    def test_layout_is_reused_until_profile_or_detector_presets_change(
+        self,
+        monkeypatch,
+    ) -> None:
+        monkeypatch.setattr(dash, "register_page", lambda *args, **kwargs: None)
+
+        scattering_main = importlib.import_module("RosettaX.pages.p03_scattering.main")
+        page = scattering_main.ScatterCalibrationPage()
+
+        profile_signature = ("profile",)
+        preset_signature = ("presets",)
+        monkeypatch.setattr(
+            scattering_main.RuntimeConfig,
+            "default_profile_signature",
+            classmethod(lambda cls: profile_signature),
+        )
+        monkeypatch.setattr(
+            scattering_main,
+            "get_default_detector_preset_loader",
+            lambda: SimpleNamespace(preset_signature=lambda: preset_signature),
+        )
+
+        first_layout = page.layout()
+
+        assert page.layout() is first_layout
+
+        preset_signature = ("presets", "new")
+        second_layout = page.layout()
+
+        assert second_layout is not first_layout
+        assert page.layout() is second_layout
+
+        profile_signature = ("profile", "rewritten")
+
+        assert page.layout() is not second_layout
+
+
+class Test_FluorescencePageLayout:
+    def test_layout_is_reused_until_profile_changes(
+        self,
+        monkeypatch,
+    ) -> None:
+        monkeypatch.setattr(dash, "register_page", lambda *args, **kwargs: None)
+
+        fluorescence_main = importlib.import_module("RosettaX.pages.p02_fluorescence.main")
+        page = fluorescence_main.FluorescencePage()
+
+        profile_signature = ("profile",)
+        monkeypatch.setattr(
+            fluorescence_main.RuntimeConfig,
+            "default_profile_signature",
+            classmethod(lambda cls: profile_signature),
+        )
+
+        first_layout = page.layout()
+
+        assert page.layout() is first_layout
+
+        profile_signature = ("profile", "rewritten")
+
+        assert page.layout() is not first_layout
+
+
 class Test_ScatteringModelLayout:
     def test_layout_includes_detector_brand_model_and_type_controls(self) -> None:
         section = ScatteringModel(
@@ -204,6 +335,124 @@ class Test_ScatteringModelLayout:
         assert detector_sampling_input.type == "text"
         assert detector_sampling_input.inputMode == "numeric"
 
+    def test_angular_weighting_text_only_triggers_callbacks_on_blur(self, monkeypatch) -> None:
+        registered_dependencies = []
+
+        def _capture_callback(*dependencies, **_kwargs):
+            registered_dependencies.append(dependencies)
+            return lambda function: function
+
+        monkeypatch.setattr(dash, "callback", _capture_callback)
+
+        section = ScatteringModel(
+            page=SimpleNamespace(ids=ScatteringIds()),
+            section_number=3,
+        )
+        section.register_callbacks()
+
+        angular_weighting_inputs = [
+            dependency.component_property
+            for dependencies in registered_dependencies
+            for dependency in dependencies
+            if isinstance(dependency, dash.Input)
+            and dependency.component_id == section.ids.detector_angular_weighting_json
+        ]
+
+        assert angular_weighting_inputs
+        assert set(angular_weighting_inputs) == {"n_blur"}
+
+    def test_refractive_index_presets_share_one_callback(self, monkeypatch) -> None:
+        registered_callbacks = []
+
+        def _capture_callback(*dependencies, **_kwargs):
+            def decorator(function):
+                registered_callbacks.append((dependencies, function))
+                return function
+
+            return decorator
+
+        monkeypatch.setattr(dash, "callback", _capture_callback)
+
+        section = ScatteringModel(
+            page=SimpleNamespace(ids=ScatteringIds()),
+            section_number=3,
+        )
+        section.register_callbacks()
+
+        custom_ids = [
+            section.ids.medium_refractive_index_custom,
+            section.ids.particle_refractive_index_custom,
+            section.ids.core_refractive_index_custom,
+            section.ids.shell_refractive_index_custom,
+        ]
+        preset_callbacks = [
+            function
+            for dependencies, function in registered_callbacks
+            if any(
+                isinstance(dependency, dash.Output)
+                and dependency.component_id in custom_ids
+                for dependency in dependencies
+            )
+            and any(
+                isinstance(dependency, dash.Input)
+                and dependency.component_id == section.ids.wavelength_nm
+                for dependency in dependencies
+            )
+        ]
+
+        assert [function.__name__ for function in preset_callbacks] == ["apply_refractive_index_presets"]
+
+        apply_refractive_index_presets = preset_callbacks[0]
+        callback_values = (None, "1.59", None, None, "532", "1.33", "1.5", "1.4", "1.6")
+
+        monkeypatch.setattr(
+            dash,
+            "ctx",
+            SimpleNamespace(
+                triggered_prop_ids={
+                    f"{section.ids.particle_refractive_index_source}.value": section.ids.particle_refractive_index_source,
+                },
+            ),
+        )
+
+        assert apply_refractive_index_presets(*callback_values) == (
+            dash.no_update,
+            pytest.approx(1.59),
+            dash.no_update,
+            dash.no_update,
+        )
+
+        monkeypatch.setattr(
+            dash,
+            "ctx",
+            SimpleNamespace(
+                triggered_prop_ids={
+                    f"{section.ids.wavelength_nm}.value": section.ids.wavelength_nm,
+                },
+            ),
+        )
+
+        assert apply_refractive_index_presets(*callback_values) == (
+            "1.33",
+            pytest.approx(1.59),
+            "1.4",
+            "1.6",
+        )
+
+
+class Test_ScatteringReferenceTableLayout:
+    def test_compute_model_info_badge_ids_are_unique(self) -> None:
+        section = ScatteringReferenceTable(
+            page=SimpleNamespace(ids=ScatteringIds()),
+            section_number=4,
+        )
+
+        layout = section.get_layout()
+        compute_model_button_id = section.ids.compute_model_btn
+
+        assert _count_component_id(layout, f"{compute_model_button_id}-info-target") == 1
+        assert _count_component_id(layout, f"{compute_model_button_id}-info-tooltip") == 1
+
 
 class Test_ScatteringCalibrationCallbackOutputs:
     def test_table_refractive_index_accepts_float_and_numeric_text(self) -> None:
@@ -233,6 +482,21 @@ class Test_ScatteringCalibrationCallbackOutputs:
 
         assert ScatteringCalibration._resolve_bead_table_output(rows) == rows
 
+    def test_axis_scale_toggle_only_patches_axis_types(self) -> None:
+        section = ScatteringCalibration.__new__(ScatteringCalibration)
+
+        patched_figure = section._patch_axis_scales(
+            x_log_value=["log"],
+            y_log_value=[],
+        )
+
+        operations = patched_figure.to_plotly_json()["operations"]
+
+        assert [(operation["location"], operation["params"]["value"]) for operation in operations] == [
+            (["layout", "xaxis", "type"], "log"),
+            (["layout", "yaxis", "type"], "linear"),
+        ]
+
 
 class Test_ApplyCalibrationPage:
     def test_layout_uses_model_panels_without_target_particle_model_wrapper(
@@ -286,6 +550,30 @@ class Test_ApplyCalibrationPage:
         assert preview_container is not None
         assert preview_container.style["display"] == "none"
 
+    def test_layout_is_reused_until_default_profile_changes(
+        self,
+        monkeypatch,
+    ) -> None:
+        monkeypatch.setattr(dash, "register_page", lambda *args, **kwargs: None)
+
+        apply_main = importlib.import_module("RosettaX.pages.p04_calibrate.main")
+        page = apply_main.ApplyCalibrationPage()
+
+        profile_signature = ("before",)
+        monkeypatch.setattr(
+            apply_main.RuntimeConfig,
+            "default_profile_signature",
+            classmethod(lambda cls: profile_signature),
+        )
+
+        first_layout = page.layout()
+
+        assert page.layout() is first_layout
+
+        profile_signature = ("after",)
+
+        assert page.layout() is not first_layout
+
     def test_calibration_json_upload_uses_configured_size_cap(
         self,
         monkeypatch,
@@ -395,6 +683,32 @@ class Test_ApplyCalibrationPage:
         )
 
 
+class Test_SettingsPage:
+    def test_layout_is_reused_until_profile_files_change(
+        self,
+        monkeypatch,
+    ) -> None:
+        monkeypatch.setattr(dash, "register_page", lambda *args, **kwargs: None)
+
+        settings_main = importlib.import_module("RosettaX.pages.p05_settings.main")
+        page = settings_main.SettingsPage()
+
+        profile_signature = ("before",)
+        monkeypatch.setattr(
+            settings_main.BrowserProfileLibrary,
+            "seed_data_signature",
+            classmethod(lambda cls: profile_signature),
+        )
+
+        first_layout = page.layout()
+
+        assert page.layout() is first_layout
+
+        profile_signature = ("after",)
+
+        assert page.layout() is not first_layout
+
+
 class Test_DocumentationPage:
     def test_layout_includes_core_documentation_sections(self, monkeypatch) -> None:
         monkeypatch.setattr(dash, "register_page", lambda *args, **kwargs: None)
@@ -638,6 +952,14 @@ class Test_HelpPage:
         assert "/sample-files" in hrefs
         assert "https://github.com/MartinPdeS/RosettaX" in hrefs
 
+    def test_layout_is_built_once_per_page_instance(self, monkeypatch) -> None:
+        monkeypatch.setattr(dash, "register_page", lambda *args, **kwargs: None)
+
+        help_main = importlib.import_module("RosettaX.pages.p06_help.main")
+        page = help_main.HelpPage()
+
+        assert page.layout() is page.layout()
+
 
 class Test_SidebarNavigation:
     def test_navigation_includes_documentation_link(self) -> None:
@@ -674,6 +996,46 @@ class Test_SidebarNavigation:
         assert text_nodes.index("Documentation") < text_nodes.index("Sample files")
         assert text_nodes.index("Sample files") < text_nodes.index("Help")
 
+    def test_unchanged_profile_options_are_not_resent(self, monkeypatch) -> None:
+        registered_callbacks = []
+
+        def capture_callback(*args, **kwargs):
+            def decorator(function):
+                registered_callbacks.append(function)
+                return function
+
+            return decorator
+
+        monkeypatch.setattr(dash, "callback", capture_callback)
+        Sidebar().register_callbacks()
+
+        initialize_or_sync_selected_profile = next(
+            function
+            for function in registered_callbacks
+            if function.__name__ == "initialize_or_sync_selected_profile"
+        )
+        profile_options = sidebar_services.build_saved_profile_options(None)
+
+        assert profile_options
+
+        selected_value = profile_options[0]["value"]
+
+        unchanged_result = initialize_or_sync_selected_profile(
+            None,
+            selected_value,
+            selected_value,
+            profile_options,
+        )
+        refreshed_result = initialize_or_sync_selected_profile(
+            None,
+            selected_value,
+            selected_value,
+            [],
+        )
+
+        assert unchanged_result == (dash.no_update, dash.no_update, dash.no_update)
+        assert refreshed_result == (profile_options, dash.no_update, dash.no_update)
+
     def test_logo_links_to_home_page(self) -> None:
         sidebar = Sidebar()
 
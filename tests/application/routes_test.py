@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+import gzip
+import json
 import sys
 import types
 from pathlib import Path
@@ -26,7 +28,7 @@ sys.modules.setdefault(
     _DashBootstrapComponentsStub("dash_bootstrap_components"),
 )
 
-from RosettaX.application.routes import register_server_routes
+from RosettaX.application.routes import register_response_compression, register_server_routes
 from RosettaX.utils.streamed_uploads import resolve_streamed_upload
 
 
@@ -139,3 +141,31 @@ class Test_ApplicationRoutes:
         assert response.status_code == 400
         assert "Could not open calibration" in response.get_data(as_text=True)
         assert "could not be opened" in response.get_data(as_text=True)
+
+    def test_large_json_responses_are_gzipped_for_accepting_clients(self) -> None:
+        app = dash.Dash(__name__)
+        app.layout = html.Div()
+        register_response_compression(app)
+
+        payload = {"values": list(range(2000))}
+
+        @app.server.route("/_test/large-json")
+        def large_json():
+            return app.server.response_class(
+                json.dumps(payload),
+                mimetype="application/json",
+            )
+
+        client = app.server.test_client()
+
+        compressed_response = client.get(
+            "/_test/large-json",
+            headers={"Accept-Encoding": "gzip, deflate"},
+        )
+        plain_response = client.get("/_test/large-json")
+
+        assert compressed_response.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in compressed_response.headers["Vary"]
+        assert json.loads(gzip.decompress(compressed_response.get_data())) == payload
+        assert "Content-Encoding" not in plain_response.headers
+        assert plain_response.get_json() == payload
@@ -36,20 +36,13 @@ class Test_FilePickerPreview:
         self,
         monkeypatch,
     ) -> None:
-        class FakeFCSFile:
-            def __init__(self, path):
-                self.path = path
-
-            def __enter__(self):
-                return self
+        read_paths: list[str] = []
 
-            def __exit__(self, *_args):
-                return None
+        def fake_read_detector_header(path):
+            read_paths.append(path)
+            return ["FSC-A", "SSC-A"], None
 
-            def get_column_names(self):
-                return ["FSC-A", "SSC-A"]
-
-        monkeypatch.setattr(services, "FCSFile", FakeFCSFile)
+        monkeypatch.setattr(services, "read_detector_header", fake_read_detector_header)
 
         options, selected = services.build_preview_channel_selection(
             selected_file="/tmp/input.fcs",
@@ -62,25 +55,19 @@ class Test_FilePickerPreview:
             {"label": "SSC-A", "value": "SSC-A"},
         ]
         assert selected == "SSC-A"
+        assert read_paths == ["/tmp/input.fcs"]
 
     def test_channel_selection_filters_to_calibration_source_channels(
         self,
         monkeypatch,
     ) -> None:
-        class FakeFCSFile:
-            def __init__(self, path):
-                self.path = path
-
-            def __enter__(self):
-                return self
+        read_paths: list[str] = []
 
-            def __exit__(self, *_args):
-                return None
+        def fake_read_detector_header(path):
+            read_paths.append(path)
+            return ["FSC-A", "SSC-A", "FITC-A"], None
 
-            def get_column_names(self):
-                return ["FSC-A", "SSC-A", "FITC-A"]
-
-        monkeypatch.setattr(services, "FCSFile", FakeFCSFile)
+        monkeypatch.setattr(services, "read_detector_header", fake_read_detector_header)
 
         options, selected = services.build_preview_channel_selection(
             selected_file="/tmp/input.fcs",
@@ -1,8 +1,14 @@
 # -*- coding: utf-8 -*-
 
+from typing import Any
+import json
+import re
+import types
+
 import dash
 
 from RosettaX.pages.p02_fluorescence.sections.s03_table import callbacks
+from RosettaX.workflow.table.fluorescence import FluorescenceReferenceTable
 
 
 class Test_FluorescenceReferenceTableCallbacks:
@@ -42,3 +48,45 @@ class Test_FluorescenceReferenceTableCallbacks:
         ]
         assert page_state_result["last_detector_channels"] == ["R1-H"]
         assert page_state_result["reference_table_rows"] == table_result
+
+    def test_add_row_is_registered_as_a_clientside_callback(self, monkeypatch) -> None:
+        registered_callbacks: list[tuple[Any, tuple, dict]] = []
+
+        monkeypatch.setattr(
+            callbacks.dash,
+            "clientside_callback",
+            lambda function, *args, **kwargs: registered_callbacks.append((function, args, kwargs)),
+        )
+
+        section = types.SimpleNamespace(
+            ids=types.SimpleNamespace(
+                bead_table="fluorescence-bead-table",
+                add_row_btn="fluorescence-add-row-btn",
+            ),
+        )
+
+        callbacks._register_add_row_callback(section)
+
+        [(function, dependencies, options)] = registered_callbacks
+
+        assert [type(dependency) for dependency in dependencies] == [
+            dash.Output,
+            dash.Input,
+            dash.State,
+        ]
+        assert [str(dependency) for dependency in dependencies] == [
+            "fluorescence-bead-table.data",
+            "fluorescence-add-row-btn.n_clicks",
+            "fluorescence-bead-table.data",
+        ]
+        assert dependencies[0].allow_duplicate is True
+        assert options == {"prevent_initial_call": True}
+
+        appended_row_match = re.search(r"concat\(\[(.*)\]\)", function)
+
+        assert appended_row_match is not None
+
+        appended_row = json.loads(appended_row_match.group(1))
+
+        assert appended_row == FluorescenceReferenceTable.empty_row
+        assert FluorescenceReferenceTable.add_empty_row(rows=[]) == [appended_row]
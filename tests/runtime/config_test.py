@@ -581,6 +581,72 @@ class Test_RuntimeConfig:
 
         assert loaded_runtime_config.to_dict() == runtime_config.to_dict()
 
+    def test_from_json_path_reuses_normalized_payload_until_file_changes(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+    ) -> None:
+        json_path = tmp_path / "cached_runtime_config.json"
+        json_path.write_text(json.dumps({"ui": {"theme_mode": "dark"}}), encoding="utf-8")
+
+        normalized_payload_count = 0
+        normalized_payload = RuntimeConfig._normalized_payload.__func__
+
+        def counting_normalized_payload(cls, **kwargs):
+            nonlocal normalized_payload_count
+            normalized_payload_count += 1
+            return normalized_payload(cls, **kwargs)
+
+        monkeypatch.setattr(RuntimeConfig, "_normalized_payload", classmethod(counting_normalized_payload))
+
+        first_runtime_config = RuntimeConfig.from_json_path(json_path)
+        first_runtime_config.set_path("ui.theme_mode", "light")
+        second_runtime_config = RuntimeConfig.from_json_path(json_path)
+
+        assert normalized_payload_count == 1
+        assert second_runtime_config.get_path("ui.theme_mode") == "dark"
+        assert second_runtime_config.validate_known_paths_on_init is False
+
+        first_runtime_config.to_json_path(json_path)
+        third_runtime_config = RuntimeConfig.from_json_path(json_path)
+
+        assert third_runtime_config.get_path("ui.theme_mode") == "light"
+        assert not json_path.with_suffix(".json.tmp").exists()
+
+    def test_from_trusted_payload_skips_normalization_and_copies_payload(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        payload = RuntimeConfig.from_dict({"ui": {"theme_mode": "dark"}}).to_dict()
+
+        def fail_normalized_payload(cls, **kwargs):
+            raise AssertionError("Trusted payloads must not be normalized again.")
+
+        monkeypatch.setattr(RuntimeConfig, "_normalized_payload", classmethod(fail_normalized_payload))
+
+        runtime_config = RuntimeConfig.from_trusted_payload(payload)
+        runtime_config.set_path("ui.theme_mode", "light")
+
+        assert runtime_config.validate_known_paths_on_init is False
+        assert payload["ui"]["theme_mode"] == "dark"
+
+    def test_to_json_path_removes_temporary_file_when_write_fails(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+    ) -> None:
+        json_path = tmp_path / "runtime_config.json"
+        json_path.write_text(json.dumps({"ui": {"theme_mode": "dark"}}), encoding="utf-8")
+        runtime_config = RuntimeConfig.from_json_path(json_path)
+
+        monkeypatch.setattr(RuntimeConfig, "to_dict", lambda self: {"ui": object()})
+
+        with pytest.raises(TypeError):
+            runtime_config.to_json_path(json_path)
+
+        assert not json_path.with_suffix(".json.tmp").exists()
+        assert json.loads(json_path.read_text(encoding="utf-8")) == {"ui": {"theme_mode": "dark"}}
+
     def test_to_json_path_validates_before_writing(self, tmp_path: Path) -> None:
         runtime_config = RuntimeConfig.from_dict({})
         runtime_config.data["ui"]["theme_mode"] = "pink"
@@ -719,6 +785,33 @@ class Test_RuntimeConfig:
 
         assert runtime_config.get_path("ui.theme_mode") == "dark"
 
+    def test_default_profile_signature_tracks_profile_rewrites(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        default_profile_path = tmp_path / "startup_default.json"
+        profiles_directory = tmp_path / "profiles"
+        profiles_directory.mkdir()
+
+        monkeypatch.setattr(
+            runtime_config_module.directories, "default_profile", default_profile_path
+        )
+        monkeypatch.setattr(
+            runtime_config_module.directories, "profiles", profiles_directory
+        )
+
+        missing_signature = RuntimeConfig.default_profile_signature()
+
+        assert missing_signature == (
+            (str(default_profile_path), None),
+            (str(profiles_directory / "default_profile.json"), None),
+        )
+
+        default_profile_path.write_text("{}", encoding="utf-8")
+
+        assert RuntimeConfig.default_profile_signature() != missing_signature
+
     def test_from_default_profile_falls_back_to_profiles_default_profile(
         self,
         tmp_path: Path,
@@ -5,6 +5,7 @@ import pytest
 from dataclasses import FrozenInstanceError
 from unittest.mock import patch
 
+from RosettaX.workflow.scattering import calibration_services
 from RosettaX.workflow.scattering.calibration_services import (
     DEFAULT_SOURCE_POLARIZATION_ANGLE_DEGREE,
     OpticalParameters,
@@ -342,3 +343,30 @@ class Test_parse_optical_parameters:
             optical_parameters.detector_angular_weights,
             np.asarray([1.0, 0.0, 0.5, 0.0], dtype=np.complex128),
         )
+
+
+class Test_log_array_summary:
+    class _RecordingArray:
+        def __init__(self) -> None:
+            self.conversion_count = 0
+
+        def __array__(self, dtype=None, copy=None):
+            self.conversion_count += 1
+            return np.asarray([1.0, np.nan, 3.0], dtype=dtype)
+
+    def test_array_is_not_scanned_when_debug_logging_is_disabled(self, caplog):
+        values = self._RecordingArray()
+
+        with caplog.at_level("INFO", logger=calibration_services.logger.name):
+            calibration_services._log_array_summary(name="coupling", values=values)
+
+        assert values.conversion_count == 0
+
+    def test_array_summary_is_logged_when_debug_logging_is_enabled(self, caplog):
+        values = self._RecordingArray()
+
+        with caplog.at_level("DEBUG", logger=calibration_services.logger.name):
+            calibration_services._log_array_summary(name="coupling", values=values)
+
+        assert values.conversion_count == 1
+        assert "coupling summary: size=3 finite_count=2" in caplog.text
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+from types import SimpleNamespace
+
+import dash
+
+from RosettaX.pages.p05_settings.ids import Ids
+from RosettaX.pages.p05_settings.sections.s01_default import main as default_main
+
+
+class Test_SettingsDefaultSectionCallbacks:
+    def test_section_toggles_share_one_pattern_matching_callback(self, monkeypatch) -> None:
+        registered_dependencies = []
+
+        def _capture_callback(*dependencies, **_kwargs):
+            registered_dependencies.append(dependencies)
+            return lambda function: function
+
+        monkeypatch.setattr(default_main, "callback", _capture_callback)
+
+        section = default_main.DefaultProfile(page=SimpleNamespace(ids=Ids()))
+        section.register_callbacks()
+
+        toggle_type = Ids.Default.section_toggle_target("fluorescence")["type"]
+        toggle_callbacks = [
+            dependencies
+            for dependencies in registered_dependencies
+            if any(
+                isinstance(dependency, dash.Input)
+                and isinstance(dependency.component_id, dict)
+                and dependency.component_id.get("type") == toggle_type
+                for dependency in dependencies
+            )
+        ]
+
+        assert len(toggle_callbacks) == 1
+        assert toggle_callbacks[0][2].component_id["section"] is dash.MATCH
+
+    def test_concrete_section_ids_are_stringified(self) -> None:
+        assert Ids.Default.section_collapse(3)["section"] == "3"
+
+
+class Test_SettingsDefaultSectionLayout:
+    def test_layout_reuses_seeded_default_profile_for_the_form(self, monkeypatch) -> None:
+        seeded_libraries = []
+        from_seed_data = default_main.BrowserProfileLibrary.from_seed_data
+
+        def _counting_from_seed_data():
+            library = from_seed_data()
+            seeded_libraries.append(library)
+            return library
+
+        def _unexpected_default_profile_read():
+            raise AssertionError("The default profile should come from the seeded library.")
+
+        monkeypatch.setattr(default_main.BrowserProfileLibrary, "from_seed_data", _counting_from_seed_data)
+        monkeypatch.setattr(default_main.RuntimeConfig, "from_default_profile", _unexpected_default_profile_read)
+
+        section = default_main.DefaultProfile(page=SimpleNamespace(ids=Ids()))
+        section.get_layout()
+
+        assert len(seeded_libraries) == 1
+
+    def test_field_rows_use_shared_css_classes(self) -> None:
+        section = default_main.DefaultProfile(page=SimpleNamespace(ids=Ids()))
+        layout = section.get_layout()
+
+        labels = []
+        pending_nodes = [layout]
+
+        while pending_nodes:
+            node = pending_nodes.pop()
+
+            if node is None or isinstance(node, str):
+                continue
+
+            if isinstance(node, (list, tuple)):
+                pending_nodes.extend(node)
+                continue
+
+            if isinstance(node, dash.html.Label):
+                labels.append(node)
+
+            children = getattr(node, "children", None)
+
+            if children is not None:
+                pending_nodes.append(children)
+
+        field_labels = [
+            label for label in labels
+            if getattr(label, "className", None) == "settings-field-label"
+        ]
+
+        assert len(field_labels) > 10
+        assert all(getattr(label, "style", None) is None for label in field_labels)
@@ -162,4 +162,26 @@ def test_delete_profile_rejects_default_and_reselects_default():
     updated_library = library.delete_profile(profile_name="custom")
 
     assert "custom.json" not in updated_library.profiles
-    assert updated_library.selected_profile == DEFAULT_PROFILE_FILENAME
\ No newline at end of file
+    assert updated_library.selected_profile == DEFAULT_PROFILE_FILENAME
+
+
+def test_seed_data_signature_tracks_packaged_profile_files(monkeypatch, tmp_path):
+    monkeypatch.setattr(browser_profiles.directories, "profiles", tmp_path)
+    monkeypatch.setattr(
+        browser_profiles.RuntimeConfig,
+        "default_profile_signature",
+        classmethod(lambda cls: ()),
+    )
+
+    profile_path = tmp_path / "lab_profile.json"
+    profile_path.write_text("{}", encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("ignored", encoding="utf-8")
+
+    first_signature = BrowserProfileLibrary.seed_data_signature()
+
+    assert BrowserProfileLibrary.seed_data_signature() == first_signature
+    assert [name for name, _ in first_signature[0]] == ["lab_profile.json"]
+
+    (tmp_path / "other_profile.json").write_text("{}", encoding="utf-8")
+
+    assert BrowserProfileLibrary.seed_data_signature() != first_signature
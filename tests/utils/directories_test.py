@@ -113,3 +113,13 @@ class Test_Directories:
 
         with pytest.raises(RuntimeError, match="Unsupported operating system"):
             directories.open_directory(tmp_path)
+
+    def test_list_json_file_names_skips_directories_and_other_suffixes(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        (tmp_path / "alpha.json").write_text("{}", encoding="utf-8")
+        (tmp_path / "notes.txt").write_text("ignore", encoding="utf-8")
+        (tmp_path / "folder.json").mkdir()
+
+        assert directories.list_json_file_names(tmp_path) == ["alpha.json"]
@@ -275,5 +275,24 @@ def test_fcs_reader_raises_for_missing_file() -> None:
             pass
 
 
+@pytest.mark.parametrize(
+    ("payload", "expected_tokens"),
+    [
+        ("$PAR/2/$P1N/FSC-A/", ["$PAR", "2", "$P1N", "FSC-A"]),
+        ("$P1N/FSC//A/$P1S/a////b/", ["$P1N", "FSC/A", "$P1S", "a//b"]),
+        ("$COM/a///b", ["$COM", "a/", "b"]),
+        ("", []),
+    ],
+)
+def test_split_text_payload_honours_escaped_delimiters(
+    payload: str,
+    expected_tokens: list[str],
+) -> None:
+    """
+    Test that doubled delimiters are kept as literal characters.
+    """
+    assert FCSFile._split_text_payload(payload, "/") == expected_tokens
+
+
 if __name__ == "__main__":
     pytest.main(["-W", "error", __file__])
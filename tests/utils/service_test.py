@@ -168,6 +168,14 @@ class Test_Service:
     ) -> None:
         assert service.list_saved_calibrations_from_directory(directory=tmp_path) == []
 
+    def test_list_saved_calibrations_from_directory_returns_empty_list_when_missing(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        assert service.list_saved_calibrations_from_directory(
+            directory=tmp_path / "not_created_yet",
+        ) == []
+
     @pytest.mark.parametrize(
         ("uploaded_fcs_path_data", "expected_path"),
         [
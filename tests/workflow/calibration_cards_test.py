@@ -62,3 +62,56 @@ class Test_CalibrationCards:
             "section": "1",
         }
         assert result.children[0].children.style["cursor"] == "pointer"
+
+    def test_section_layouts_read_default_profile_once(self, monkeypatch) -> None:
+        calls = []
+
+        class _Profile:
+            def to_dict(self) -> dict:
+                return {"ui": {"collapse_calibration_cards": True}}
+
+        def _from_default_profile():
+            calls.append(1)
+            return _Profile()
+
+        monkeypatch.setattr(
+            calibration_cards.RuntimeConfig,
+            "from_default_profile",
+            staticmethod(_from_default_profile),
+        )
+
+        class _Section:
+            def __init__(self, section_number: int) -> None:
+                self.section_number = section_number
+
+            def get_layout(self) -> dbc.Card:
+                return dbc.Card([dbc.CardHeader("Section"), dbc.CardBody("Body")])
+
+        results = calibration_cards.build_collapsible_section_layouts(
+            [_Section(1), _Section(2), _Section(3)],
+            page_name="test-page",
+        )
+
+        assert len(calls) == 1
+        assert [result.children[1].kwargs["is_open"] for result in results] == [False, False, False]
+
+    def test_card_toggle_is_registered_as_a_clientside_callback(self) -> None:
+        from RosettaX.application import callbacks as application_callbacks
+
+        clientside_callbacks = []
+
+        class _App:
+            def callback(self, *args, **kwargs):
+                return lambda function: function
+
+            def clientside_callback(self, function, *args, **kwargs):
+                clientside_callbacks.append((function, args, kwargs))
+
+        application_callbacks.register_application_callbacks(_App())
+
+        [(function, dependencies, options)] = clientside_callbacks
+
+        assert function == calibration_cards.CARD_TOGGLE_CLIENTSIDE_FUNCTION
+        assert dependencies[0].component_id["type"] == calibration_cards.COLLAPSE_ID_TYPE
+        assert dependencies[1].component_id["type"] == calibration_cards.TOGGLE_LABEL_ID_TYPE
+        assert options == {"prevent_initial_call": False}
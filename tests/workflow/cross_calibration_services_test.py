@@ -168,6 +168,24 @@ class Test_CrossCalibrationServices:
         assert payload["payload"]["transfer_role"] == "primary_to_secondary"
         assert payload["payload"]["name"] == "apogee_fitc_cross"
 
+    @pytest.mark.parametrize(
+        ("result", "export_name", "expected"),
+        [
+            (None, "cross", True),
+            ([], "cross", True),
+            ({}, None, True),
+            ({}, "   ", True),
+            ({}, "cross", False),
+        ],
+    )
+    def test_export_button_should_be_disabled(
+        self,
+        result,
+        export_name,
+        expected: bool,
+    ) -> None:
+        assert services.export_button_should_be_disabled(result, export_name) is expected
+
     def test_build_result_figure_sets_stable_uirevision(self) -> None:
         result = {
             "primary_file_name": "primary.json",
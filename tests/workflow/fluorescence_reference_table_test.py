@@ -165,3 +165,13 @@ class Test_FluorescenceReferencePresets:
 
         assert SUMMER_SCHOOL_APOGEE_APC_FLUORESCENCE_REFERENCE_PRESET_NAME in option_values
         assert SUMMER_SCHOOL_CYTEK_FITC_FLUORESCENCE_REFERENCE_PRESET_NAME in option_values
+
+    def test_add_empty_row_does_not_alias_input_rows_or_template(self):
+        rows = [{"col1": "1", "col2": "2"}]
+
+        next_rows = FluorescenceReferenceTable.add_empty_row(rows=rows)
+        next_rows[-1]["col1"] = "edited"
+
+        assert rows == [{"col1": "1", "col2": "2"}]
+        assert next_rows[0] is not rows[0]
+        assert FluorescenceReferenceTable.empty_row == {"col1": "", "col2": ""}
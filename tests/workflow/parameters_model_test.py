@@ -294,6 +294,22 @@ class Test_DetectorPresetLoaderCatalog:
         assert apogee_forward["detector_angular_weighting"]["separation_angle_degree"] == 10.0
 
 
+    def test_preset_signature_tracks_preset_file_changes(self, tmp_path):
+        brand_directory = tmp_path / "brand"
+        brand_directory.mkdir()
+        (brand_directory / "first.json").write_text("{}", encoding="utf-8")
+        (brand_directory / "notes.txt").write_text("ignored", encoding="utf-8")
+
+        loader = DetectorPresetLoader(tmp_path)
+        first_signature = loader.preset_signature()
+
+        assert loader.preset_signature() == first_signature
+        assert [Path(path).name for path, _ in first_signature] == ["first.json"]
+
+        (brand_directory / "second.json").write_text("{}", encoding="utf-8")
+
+        assert loader.preset_signature() != first_signature
+
 class Test_ScattererPresetDefaults:
     def test_scatterer_preset_options_start_with_no_preset(self):
         assert ModelConfiguration.build_scatterer_preset_options()[0] == {
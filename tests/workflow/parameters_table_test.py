@@ -17,7 +17,9 @@ from RosettaX.workflow.parameters.table import (
     core_shell_table_columns,
     resolve_mie_model,
     get_table_columns_for_model,
-    get_user_data_column_ids_for_model
+    get_user_data_column_ids_for_model,
+    build_empty_row_for_model,
+    build_empty_rows_for_model,
 )
 
 
@@ -300,6 +302,41 @@ class Test_get_user_data_column_ids_for_model:
         mock_get_column_ids.assert_called_once()
 
 
+
+class Test_build_empty_rows_for_model:
+    """Test suite for the empty row templates."""
+
+    @pytest.mark.parametrize(
+        "mie_model, columns",
+        [
+            (MIE_MODEL_SOLID_SPHERE, sphere_table_columns),
+            (MIE_MODEL_CORE_SHELL_SPHERE, core_shell_table_columns),
+        ],
+    )
+    def test_empty_rows_have_every_column_key(self, mie_model, columns):
+        """Test empty rows carry one blank value per table column."""
+        rows = build_empty_rows_for_model(mie_model, row_count=2)
+
+        expected_row = {column["id"]: "" for column in columns}
+
+        assert rows == [expected_row, expected_row]
+
+    @pytest.mark.parametrize(
+        "mie_model",
+        [MIE_MODEL_SOLID_SPHERE, MIE_MODEL_CORE_SHELL_SPHERE],
+    )
+    def test_empty_rows_are_separate_dict_objects(self, mie_model):
+        """Test editing one appended row leaves the others and the template untouched."""
+        rows = build_empty_rows_for_model(mie_model, row_count=2)
+        rows.append(build_empty_row_for_model(mie_model))
+
+        assert len({id(row) for row in rows}) == 3
+
+        rows[0][COLUMN_MEASURED_PEAK_POSITION] = "123"
+
+        assert rows[1][COLUMN_MEASURED_PEAK_POSITION] == ""
+        assert build_empty_row_for_model(mie_model)[COLUMN_MEASURED_PEAK_POSITION] == ""
+
 class Test_table_integration:
     """Integration tests for table functions working together."""
 
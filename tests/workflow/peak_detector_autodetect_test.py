@@ -4,9 +4,11 @@ import json
 import sys
 import types
 
+import pandas as pd
 import pytest
 
 from RosettaX.utils.fcs_metadata import FCSMetadata
+from RosettaX.utils.reader import FCSFile
 
 
 class _DashBootstrapComponentsSentinel:
@@ -578,3 +580,168 @@ class Test_DetectorAutoDetect:
         )
 
         assert resolved_channel == "SSC-A"
+
+    def test_read_detector_header_reuses_parse_for_unchanged_file(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path,
+    ) -> None:
+        fcs_path = tmp_path / "beads.fcs"
+        fcs_path.write_bytes(b"placeholder")
+
+        metadata = build_metadata(
+            instrument_name="CytoFLEX S",
+            column_names=["FSC-A", "SSC-A"],
+        )
+        opened_paths: list[str] = []
+
+        class CountingFakeFCSFile(FakeFCSFile):
+            def get_column_names(self) -> list[str]:
+                return list(self.metadata.column_names)
+
+        def open_fcs_file(path: str) -> CountingFakeFCSFile:
+            opened_paths.append(path)
+            return CountingFakeFCSFile(metadata)
+
+        monkeypatch.setattr(detectors, "FCSFile", open_fcs_file)
+        detectors.clear_detector_header_cache()
+
+        first_column_names, first_metadata = detectors.read_detector_header(str(fcs_path))
+        first_column_names.append("mutated")
+        second_column_names, second_metadata = detectors.read_detector_header(str(fcs_path))
+
+        assert second_column_names == ["FSC-A", "SSC-A"]
+        assert second_metadata is first_metadata
+        assert len(opened_paths) == 1
+
+        fcs_path.write_bytes(b"placeholder with new content")
+        detectors.read_detector_header(str(fcs_path))
+
+        assert len(opened_paths) == 2
+
+        detectors.clear_detector_header_cache()
+
+    def test_read_detector_header_reuses_parse_for_same_file_under_new_path(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path,
+    ) -> None:
+        fcs_bytes = FCSFile.builder_from_dataframe(
+            pd.DataFrame({"FSC-A": [1.0, 2.0], "SSC-A": [3.0, 4.0]}),
+        ).build_bytes()
+        first_path = tmp_path / "session_a" / "beads.fcs"
+        second_path = tmp_path / "session_b" / "beads.fcs"
+
+        for fcs_path in (first_path, second_path):
+            fcs_path.parent.mkdir()
+            fcs_path.write_bytes(fcs_bytes)
+
+        opened_paths: list[str] = []
+
+        def open_fcs_file(path: str) -> FCSFile:
+            opened_paths.append(path)
+            return FCSFile(path)
+
+        monkeypatch.setattr(detectors, "FCSFile", open_fcs_file)
+        detectors.clear_detector_header_cache()
+
+        first_column_names, first_metadata = detectors.read_detector_header(str(first_path))
+        second_column_names, second_metadata = detectors.read_detector_header(str(second_path))
+
+        assert first_column_names == second_column_names == ["FSC-A", "SSC-A"]
+        assert opened_paths == [str(first_path.resolve())]
+        assert second_metadata.file_path == str(second_path.resolve())
+        assert first_metadata.file_path == str(first_path.resolve())
+
+        detectors.clear_detector_header_cache()
+
+    def test_read_detector_header_does_not_share_files_without_text_offsets(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path,
+    ) -> None:
+        first_path = tmp_path / "first.fcs"
+        second_path = tmp_path / "second.fcs"
+        first_path.write_bytes(b"FCS3.1" + b" " * 52 + b"first payload")
+        second_path.write_bytes(b"FCS3.1" + b" " * 52 + b"other payload")
+
+        column_names_by_path = {
+            str(first_path.resolve()): ["FSC-A", "SSC-A"],
+            str(second_path.resolve()): ["FL1-A", "FL2-A"],
+        }
+
+        class PathFakeFCSFile(FakeFCSFile):
+            def __init__(self, path: str) -> None:
+                super().__init__(
+                    build_metadata(
+                        instrument_name="CytoFLEX S",
+                        column_names=column_names_by_path[path],
+                    )
+                )
+
+            def get_column_names(self) -> list[str]:
+                return list(self.metadata.column_names)
+
+        monkeypatch.setattr(detectors, "FCSFile", PathFakeFCSFile)
+        detectors.clear_detector_header_cache()
+
+        first_column_names, _ = detectors.read_detector_header(str(first_path))
+        second_column_names, _ = detectors.read_detector_header(str(second_path))
+
+        assert first_column_names == ["FSC-A", "SSC-A"]
+        assert second_column_names == ["FL1-A", "FL2-A"]
+
+        detectors.clear_detector_header_cache()
+
+    @pytest.mark.parametrize("rules_module", [detector_configuration, detectors])
+    def test_load_detector_auto_detect_rules_reuses_parse_for_unchanged_file(
+        self,
+        tmp_path,
+        monkeypatch: pytest.MonkeyPatch,
+        rules_module,
+    ) -> None:
+        rules_path = tmp_path / "detector_auto_detect_rules.json"
+        rule = {
+            "name": "CytoFLEX",
+            "instrument_aliases": ["CytoFLEX"],
+            "detector_channels": {"scatter": ["SSC-A"]},
+        }
+        rules_path.write_text(
+            json.dumps({"rules": [rule]}),
+            encoding="utf-8",
+        )
+        monkeypatch.setattr(
+            rules_module,
+            "DETECTOR_AUTO_DETECT_RULES_PATH",
+            rules_path,
+        )
+
+        read_paths: list[str] = []
+        original_read_text = rules_module.Path.read_text
+
+        def counting_read_text(path, *args, **kwargs):
+            read_paths.append(str(path))
+            return original_read_text(path, *args, **kwargs)
+
+        monkeypatch.setattr(rules_module.Path, "read_text", counting_read_text)
+
+        first_rules = rules_module.load_detector_auto_detect_rules()
+        second_rules = rules_module.load_detector_auto_detect_rules()
+
+        assert [loaded_rule["name"] for loaded_rule in first_rules] == ["CytoFLEX"]
+        assert second_rules == first_rules
+        assert read_paths == [str(rules_path)]
+
+        first_rules[0]["detector_channels"]["scatter"].append("FSC-A")
+
+        assert rules_module.load_detector_auto_detect_rules()[0]["detector_channels"] == {
+            "scatter": ["SSC-A"],
+        }
+
+        rules_path.write_text(
+            json.dumps({"rules": [rule, dict(rule, name="CytoFLEX S")]}),
+            encoding="utf-8",
+        )
+
+        assert len(rules_module.load_detector_auto_detect_rules()) == 2
+        assert len(read_paths) == 2
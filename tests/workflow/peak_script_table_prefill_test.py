@@ -2,6 +2,8 @@
 
 import logging
 
+import pytest
+
 from RosettaX.workflow.peak.adapters.fluorescence import FluorescencePeakWorkflowAdapter
 from RosettaX.workflow.peak.adapters.scattering import ScatteringPeakWorkflowAdapter
 
@@ -292,3 +294,37 @@ class Test_ScatteringPeakScriptTablePrefill:
         assert table_result[0]["core_refractive_index"] == "Polystyrene(1.59796)"
         assert table_result[0]["shell_refractive_index"].startswith("Phospholipid(")
         assert table_result[0]["medium_refractive_index"] == "Water(1.33698)"
+
+
+class Test_FindFirstEmptyValueRowIndex:
+    @pytest.mark.parametrize(
+        "adapter",
+        [FluorescencePeakWorkflowAdapter(), ScatteringPeakWorkflowAdapter()],
+    )
+    def test_search_starts_at_start_index(self, adapter) -> None:
+        rows = [
+            {"value": ""},
+            {"value": "filled"},
+            {"value": None},
+            {"value": "   "},
+        ]
+
+        assert adapter.find_first_empty_value_row_index(
+            rows=rows,
+            column_name="value",
+        ) == 0
+        assert adapter.find_first_empty_value_row_index(
+            rows=rows,
+            column_name="value",
+            start_index=1,
+        ) == 2
+        assert adapter.find_first_empty_value_row_index(
+            rows=rows,
+            column_name="value",
+            start_index=3,
+        ) == 3
+        assert adapter.find_first_empty_value_row_index(
+            rows=rows,
+            column_name="value",
+            start_index=4,
+        ) is None
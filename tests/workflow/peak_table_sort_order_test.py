@@ -53,6 +53,25 @@ class Test_FluorescencePeakTableSortOrder:
 
         assert [row["col2"] for row in table_result] == [30, 20, 10]
 
+    def test_apply_peak_process_result_to_table_fills_gaps_then_appends_rows(self):
+        adapter = FluorescencePeakWorkflowAdapter()
+
+        table_result = adapter.apply_peak_process_result_to_table(
+            table_data=[
+                {"col1": "1", "col2": ""},
+                {"col1": "10", "col2": "5"},
+                {"col1": "100", "col2": None},
+            ],
+            result={
+                "new_peak_positions": [10, 20, 30, 40],
+            },
+            context={},
+            logger=logger,
+        )
+
+        assert [row["col2"] for row in table_result] == [10, "5", 20, 30, 40]
+        assert [row["col1"] for row in table_result] == ["1", "10", "100", "", ""]
+
 
 class Test_ScatteringPeakTableSortOrder:
     def test_apply_peak_process_result_to_table_sorts_values_ascending_by_default(self):
@@ -2,6 +2,7 @@
 
 from RosettaX.workflow.peak import registry
 from RosettaX.workflow.peak.callbacks import visibility
+from RosettaX.workflow.peak.layout import PeakLayout
 
 
 class Test_PeakProcessSelectionVisibility:
@@ -235,3 +236,19 @@ class Test_PeakProcessFiltering:
             getattr(script, "process_name", "")
             for script in scripts
         ]
+
+
+class Test_PeakProcessSettingControls:
+    def test_text_setting_input_is_debounced_like_numeric_settings(self) -> None:
+        peak_layout = PeakLayout.__new__(PeakLayout)
+
+        control = peak_layout._build_text_setting_control(
+            input_id={"type": "peak-process-setting", "process": "demo", "setting": "label"},
+            label="Label",
+            value="beads",
+        )
+
+        text_input = control.children[1]
+
+        assert text_input.kwargs["debounce"] is True
+        assert text_input.kwargs["value"] == "beads"
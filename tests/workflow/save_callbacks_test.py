@@ -1,5 +1,12 @@
 # -*- coding: utf-8 -*-
 
+from types import SimpleNamespace
+from typing import Any
+
+import dash
+import pytest
+
+from RosettaX.workflow.save import callbacks
 from RosettaX.workflow.save.callbacks import save_button_should_be_disabled
 
 
@@ -29,3 +36,43 @@ class Test_SaveButtonVisibility:
             )
             is False
         )
+
+    @pytest.mark.parametrize("require_output_channel_name", [True, False])
+    def test_enabled_state_is_registered_as_a_clientside_callback(
+        self,
+        monkeypatch,
+        require_output_channel_name: bool,
+    ) -> None:
+        registered_callbacks: list[tuple[Any, tuple, dict]] = []
+
+        monkeypatch.setattr(
+            callbacks.dash,
+            "clientside_callback",
+            lambda function, *args, **kwargs: registered_callbacks.append((function, args, kwargs)),
+        )
+
+        callbacks._register_save_button_enabled_state_callback(
+            ids=SimpleNamespace(
+                save_calibration_btn="save-button",
+                file_name="save-file-name",
+                output_channel_name="save-output-channel-name",
+            ),
+            config=SimpleNamespace(
+                require_output_channel_name=require_output_channel_name,
+            ),
+        )
+
+        [(function, dependencies, options)] = registered_callbacks
+
+        assert [type(dependency) for dependency in dependencies] == [
+            dash.Output,
+            dash.Input,
+            dash.Input,
+        ]
+        assert [str(dependency) for dependency in dependencies] == [
+            "save-button.disabled",
+            "save-file-name.value",
+            "save-output-channel-name.value",
+        ]
+        assert options == {"prevent_initial_call": False}
+        assert f"return {str(require_output_channel_name).lower()} && isBlank(outputChannelName);" in function